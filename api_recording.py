@@ -0,0 +1,153 @@
+# api_recording.py
+# Record/replay respons mentah Blogger API supaya build bisa diulang tanpa jaringan dan tanpa API key.
+#
+#   python main.py --record .build-cache/recording     # build biasa, setiap halaman API disimpan
+#   python main.py --replay .build-cache/recording     # build dari rekaman, tanpa network
+#   python api_recording.py serve .build-cache/recording --port 8765
+#       # stand-in HTTP lokal; arahkan fetcher ke sana dengan BLOGGER_API_BASE=http://127.0.0.1:8765
+#
+# Setiap halaman disimpan apa adanya (termasuk nextPageToken asli), dengan kunci
+# (orderBy, maxResults, pageToken) permintaannya, jadi paginasi saat replay sama persis dengan API.
+# API key tidak pernah ikut tersimpan.
+import os
+import sys
+import json
+import argparse
+from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+INDEX_FILENAME = 'index.json'
+
+
+def request_key(max_results, page_token=None, order_by=None):
+    return f"{order_by or 'published'}:{max_results}:{page_token or ''}"
+
+
+def _write_json(path, payload):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+class Recorder:
+    """
+    Membungkus fungsi fetch (signature sama dengan get_blogger_posts) dan menyimpan setiap
+    respons yang berhasil ke folder rekaman.
+    """
+
+    def __init__(self, directory, fetch_page):
+        self.directory = directory
+        self.fetch_page = fetch_page
+        os.makedirs(directory, exist_ok=True)
+        self.index = {}
+        index_path = os.path.join(directory, INDEX_FILENAME)
+        if os.path.exists(index_path):
+            with open(index_path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f).get('pages', {})
+
+    def get_blogger_posts(self, blog_id, api_key, max_results=10, page_token=None, order_by=None):
+        posts_data = self.fetch_page(blog_id, api_key, max_results=max_results,
+                                     page_token=page_token, order_by=order_by)
+        if posts_data is None:
+            return None
+        key = request_key(max_results, page_token, order_by)
+        filename = self.index.get(key) or f"page-{len(self.index) + 1:05d}.json"
+        _write_json(os.path.join(self.directory, filename), posts_data)
+        self.index[key] = filename
+        # Index ditulis ulang setiap halaman, jadi rekaman yang terputus tetap bisa dipakai sebagian
+        _write_json(os.path.join(self.directory, INDEX_FILENAME), {'blog_id': blog_id, 'pages': self.index})
+        return posts_data
+
+
+class Replayer:
+    """
+    Menyajikan rekaman dengan signature get_blogger_posts. Permintaan yang tidak ada di rekaman
+    dianggap gagal (None), sama seperti error API.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        index_path = os.path.join(directory, INDEX_FILENAME)
+        if not os.path.exists(index_path):
+            raise ValueError(f"Rekaman Blogger API tidak ditemukan: {index_path}")
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        self.blog_id = index.get('blog_id')
+        self.index = index.get('pages', {})
+
+    def load(self, max_results=10, page_token=None, order_by=None):
+        filename = self.index.get(request_key(max_results, page_token, order_by))
+        if filename is None:
+            return None
+        with open(os.path.join(self.directory, filename), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def get_blogger_posts(self, blog_id, api_key, max_results=10, page_token=None, order_by=None):
+        posts_data = self.load(max_results, page_token, order_by)
+        if posts_data is None:
+            print(f"Error fetching Blogger posts: halaman {request_key(max_results, page_token, order_by)} "
+                  f"tidak ada di rekaman {self.directory}")
+        return posts_data
+
+
+def make_handler(replayer):
+    class ReplayHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            if not url.path.endswith('/posts'):
+                return self._send(404, {'error': {'code': 404, 'message': 'Not Found'}})
+            posts_data = replayer.load(int(params.get('maxResults', 10)), params.get('pageToken'),
+                                       params.get('orderBy'))
+            if posts_data is None:
+                return self._send(404, {'error': {'code': 404, 'message': 'Halaman tidak ada di rekaman'}})
+            self._send(200, posts_data)
+
+        def _send(self, status, payload):
+            body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=UTF-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Jangan cetak query string (bisa berisi API key)
+            print(f"{self.command} {urlparse(self.path).path} -> {args[1] if len(args) > 1 else ''}")
+
+    return ReplayHandler
+
+
+def serve(directory, host='127.0.0.1', port=8765):
+    """
+    Stand-in HTTP lokal untuk Blogger API yang menyajikan rekaman di directory.
+    """
+    server = ThreadingHTTPServer((host, port), make_handler(Replayer(directory)))
+    print(f"Menyajikan rekaman {directory} di http://{host}:{server.server_port} "
+          f"(set BLOGGER_API_BASE=http://{host}:{server.server_port})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record/replay Blogger API.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    serve_parser = subparsers.add_parser('serve', help="Jalankan stand-in HTTP lokal dari folder rekaman.")
+    serve_parser.add_argument('directory')
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args(argv)
+    if args.command == 'serve':
+        serve(args.directory, args.host, args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,397 @@
+# asset_pipeline.py
+# Tahap aset opsional yang dijalankan tepat saat sebuah file ditulis (di worker render atau di
+# OutputWriter), bukan sebagai pass kedua atas seluruh folder output:
+#   - minifikasi HTML yang aman: whitespace di teks antara tag diringkas dan komentar dibuang, tetapi
+#     nilai atribut serta isi <pre>, <textarea>, <script>, <style>, dan elemen ber-style white-space: pre*
+#     tidak disentuh,
+#   - CSS kritis per jenis template: aturan style.css yang selektornya dipakai template tersebut
+#     di-inline di <head>, dan style.css lengkap dimuat tanpa memblokir render,
+#   - sibling .gz (dan .br jika modul brotli terpasang) untuk host/CDN yang menyajikan file prakompresi.
+import os
+import re
+import gzip
+import hashlib
+from output_writer import write_if_changed, UNCHANGED
+from template_graph import TemplateGraph
+
+try:
+    import brotli  # Opsional: pip install brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = ('.html', '.xml', '.json', '.css', '.js', '.txt', '.svg')
+MIN_COMPRESS_BYTES = 256
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9  # 11 hanya sedikit lebih kecil tetapi jauh lebih lambat untuk ribuan halaman
+
+STYLESHEET_HREF = '/style.css'
+STYLESHEET_LINK_RE = re.compile(r'<link rel="stylesheet" href="/style\.css">')
+# Isi tag sesudah namanya; nilai atribut yang dikutip boleh berisi '>' dan whitespace
+_TAG_BODY = r'''[^<>"']*(?:(?:"[^"]*"|'[^']*')[^<>"']*)*'''
+# Komentar, atau tag beserta atributnya
+MARKUP_RE = re.compile(rf'''<!--.*?-->|<(/?)([a-zA-Z][a-zA-Z0-9-]*){_TAG_BODY}>''', re.DOTALL)
+STYLE_ATTR_RE = re.compile(r'''(?<![\w-])style\s*=\s*(?:"([^"]*)"|'([^']*)')''', re.IGNORECASE)
+# Satu pass minifikasi: komentar yang dibuang (beserta whitespace sesudahnya), komentar lain,
+# elemen yang isinya tidak disentuh, tag, atau rangkaian whitespace di teks. Satu spasi atau
+# satu baris baru sudah ringkas, jadi tidak dicocokkan sama sekali.
+MINIFY_RE = re.compile(rf'''((?:<!--(?!\[if|<!|>)(?:(?!-->).)*?-->\s*)+)
+                          |(<!--.*?-->)
+                          |(<(pre|textarea|script|style)\b{_TAG_BODY}>.*?</\4\s*>)
+                          |(</?[a-zA-Z]{_TAG_BODY}>)
+                          |((?:\s\s|[^\S \n])\s*)''', re.DOTALL | re.IGNORECASE | re.VERBOSE)
+TAG_WHITESPACE_RE = re.compile(r'''("[^"]*"|'[^']*')|\s+''')  # whitespace di dalam tag, di luar nilai atribut
+WHITE_SPACE_PRE_RE = re.compile(r'white-space\s*:\s*(?:pre|break-spaces)', re.IGNORECASE)
+RAW_TEXT_TAGS = ('script', 'style', 'textarea')
+VOID_TAGS = ('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr')
+HTML_COMMENT_RE = re.compile(r'<!--(?!\[if|<!|>)(?:(?!-->).)*?-->', re.DOTALL)
+WHITESPACE_RE = re.compile(r'\s+')
+
+CLASS_ATTR_RE = re.compile(r'''\bclass\s*=\s*(?:"([^"]*)"|'([^']*)')''')
+ID_ATTR_RE = re.compile(r'''\bid\s*=\s*(?:"([^"]*)"|'([^']*)')''')
+TAG_RE = re.compile(r'<([a-zA-Z][a-zA-Z0-9-]*)')
+CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+SELECTOR_IGNORED_RE = re.compile(r'::?[a-zA-Z-]+(?:\([^)]*\))?|\[[^\]]*\]')
+SELECTOR_CLASS_RE = re.compile(r'\.([\w-]+)')
+SELECTOR_ID_RE = re.compile(r'#([\w-]+)')
+SELECTOR_TAG_RE = re.compile(r'(?:^|[\s>+~(])([a-zA-Z][\w-]*)')
+NESTED_AT_RULES = ('@media', '@supports', '@document', '@layer')
+
+
+# --- Minifikasi HTML ---
+
+def _collapse_whitespace(text):
+    # Rangkaian whitespace setara satu spasi di HTML; baris baru dipertahankan supaya baris tetap pendek
+    return WHITESPACE_RE.sub(lambda m: '\n' if '\n' in m.group() else ' ', text)
+
+
+def _minify_match(m):
+    kind = m.lastindex
+    if kind == 6:
+        return '\n' if '\n' in m.group() else ' '
+    if kind == 5:
+        tag = m.group()
+        if '  ' in tag or '\n' in tag or '\t' in tag or '\r' in tag:
+            # Whitespace di antara atribut diringkas, nilai atribut tidak disentuh
+            return TAG_WHITESPACE_RE.sub(lambda t: t.group(1) or ('\n' if '\n' in t.group() else ' '), tag)
+        return tag
+    if kind == 1:
+        # Whitespace sebelum komentar sudah diringkas; yang sesudahnya cukup dipakai jika sebelumnya tidak ada
+        if m.start() > 0 and m.string[m.start() - 1].isspace():
+            return ''
+        return _collapse_whitespace(HTML_COMMENT_RE.sub('', m.group()))
+    return m.group()
+
+
+def _minify_markup(html):
+    return MINIFY_RE.sub(_minify_match, html)
+
+
+def _preserves_whitespace(name, tag):
+    """
+    True jika isi elemen harus disalin apa adanya: <pre>, elemen raw text, atau elemen dengan
+    inline style white-space: pre/pre-wrap/pre-line/break-spaces.
+    """
+    if name == 'pre' or name in RAW_TEXT_TAGS:
+        return True
+    if name in VOID_TAGS:
+        return False
+    return any(WHITE_SPACE_PRE_RE.search(m.group(1) or m.group(2) or '') for m in STYLE_ATTR_RE.finditer(tag))
+
+
+def _element_end(html, pos, name):
+    """
+    Posisi akhir tag penutup elemen name yang isinya mulai di pos (tag sejenis yang bersarang ikut dihitung),
+    atau len(html) jika tidak ditutup.
+    """
+    if name in RAW_TEXT_TAGS:
+        m = re.compile(r'</' + name + r'\s*>', re.IGNORECASE).search(html, pos)
+        return m.end() if m else len(html)
+    depth = 1
+    for m in MARKUP_RE.finditer(html, pos):
+        if m.group(2) is None or m.group(2).lower() != name or m.group().endswith('/>'):
+            continue
+        depth += -1 if m.group(1) else 1
+        if depth == 0:
+            return m.end()
+    return len(html)
+
+
+def _styled_pre_ranges(html):
+    """
+    (awal, akhir) elemen ber-style white-space: pre*. Halaman tanpa style itu (hampir semua) tidak di-scan.
+    """
+    if not WHITE_SPACE_PRE_RE.search(html):
+        return
+    pos = 0
+    while True:
+        m = MARKUP_RE.search(html, pos)
+        if m is None:
+            return
+        pos = m.end()
+        if m.group(2) is None or m.group(1) or m.group().endswith('/>'):
+            continue
+        name = m.group(2).lower()
+        if _preserves_whitespace(name, m.group()):
+            end = _element_end(html, pos, name)
+            # Isi <pre> dan elemen raw text ikut dilewati, tetapi sudah dilindungi oleh MINIFY_RE
+            if name != 'pre' and name not in RAW_TEXT_TAGS:
+                yield m.start(), end
+            pos = end
+
+
+def minify_html(html):
+    """
+    Whitespace hanya diringkas di teks antara tag dan di antara atribut; nilai atribut, komentar bersyarat,
+    dan isi <pre>, <textarea>, <script>, <style>, serta elemen ber-style white-space: pre* disalin apa adanya.
+    Komentar biasa dibuang.
+    """
+    out, pos = [], 0
+    for start, end in _styled_pre_ranges(html):
+        out.append(_minify_markup(html[pos:start]))
+        out.append(html[start:end])
+        pos = end
+    out.append(_minify_markup(html[pos:]))
+    return ''.join(out).strip()
+
+
+# --- CSS kritis ---
+
+def _skip_string(css, pos):
+    quote = css[pos]
+    pos += 1
+    while pos < len(css) and css[pos] != quote:
+        pos += 2 if css[pos] == '\\' else 1
+    return pos
+
+
+def _block_end(css, pos):
+    """
+    Posisi '}' penutup untuk blok yang '{'-nya ada di pos.
+    """
+    depth = 0
+    while pos < len(css):
+        ch = css[pos]
+        if ch in '"\'':
+            pos = _skip_string(css, pos)
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return pos
+        pos += 1
+    return pos
+
+
+def parse_css(css, pos=0):
+    """
+    Parser CSS minimal: mengembalikan (daftar aturan, posisi akhir). Aturan berupa
+    (prelude, isi) untuk aturan biasa, (prelude, [aturan anak]) untuk @media/@supports,
+    atau (pernyataan, None) untuk at-rule tanpa blok seperti @import.
+    """
+    rules = []
+    start = pos
+    while pos < len(css):
+        ch = css[pos]
+        if ch in '"\'':
+            pos = _skip_string(css, pos)
+        elif ch == '{':
+            prelude = css[start:pos].strip()
+            if prelude.lower().startswith(NESTED_AT_RULES):
+                children, pos = parse_css(css, pos + 1)
+                rules.append((prelude, children))
+            else:
+                end = _block_end(css, pos)
+                rules.append((prelude, css[pos + 1:end]))
+                pos = end + 1
+            start = pos
+            continue
+        elif ch == '}':
+            return rules, pos + 1
+        elif ch == ';':
+            statement = css[start:pos + 1].strip()
+            if statement.startswith('@'):
+                rules.append((statement, None))
+            start = pos + 1
+        pos += 1
+    return rules, pos
+
+
+def _split_selectors(prelude):
+    selectors, depth, start = [], 0, 0
+    for i, ch in enumerate(prelude):
+        if ch in '([':
+            depth += 1
+        elif ch in ')]':
+            depth -= 1
+        elif ch == ',' and depth == 0:
+            selectors.append(prelude[start:i])
+            start = i + 1
+    selectors.append(prelude[start:])
+    return selectors
+
+
+def _selector_used(selector, used):
+    selector = SELECTOR_IGNORED_RE.sub(' ', selector)
+    classes, ids, tags = used
+    return (all(c in classes for c in SELECTOR_CLASS_RE.findall(selector)) and
+            all(i in ids for i in SELECTOR_ID_RE.findall(selector)) and
+            all(t.lower() in tags for t in SELECTOR_TAG_RE.findall(selector)))
+
+
+def _filter_rules(rules, used):
+    out = []
+    for prelude, body in rules:
+        if body is None:
+            out.append(prelude)
+        elif isinstance(body, list):
+            children = _filter_rules(body, used)
+            if children:
+                out.append(f"{prelude}{{{''.join(children)}}}")
+        elif prelude.startswith('@'):
+            # @font-face, @keyframes, dan sejenisnya tidak punya selektor; selalu ikut
+            out.append(f"{prelude}{{{body.strip()}}}")
+        elif any(_selector_used(s, used) for s in _split_selectors(prelude)):
+            out.append(f"{prelude}{{{body.strip()}}}")
+    return out
+
+
+def template_sources(template_dir, template_name, graph=None):
+    """
+    Source template beserta semua template yang di-extends/include/fragment() darinya.
+    """
+    graph = graph or TemplateGraph(template_dir)
+    return [graph.source(name) for name in graph.dependencies(template_name)]
+
+
+def used_selectors(sources):
+    """
+    Kelas, id, dan tag yang muncul di markup template (bagian berisi ekspresi Jinja diabaikan).
+    """
+    classes, ids, tags = set(), set(), {'html', 'body'}
+    for source in sources:
+        for match in CLASS_ATTR_RE.finditer(source):
+            classes.update(t for t in (match.group(1) or match.group(2) or '').split() if '{' not in t)
+        for match in ID_ATTR_RE.finditer(source):
+            value = (match.group(1) or match.group(2) or '').strip()
+            if value and '{' not in value:
+                ids.add(value)
+        tags.update(t.lower() for t in TAG_RE.findall(source))
+    return classes, ids, tags
+
+
+def critical_css(css, sources):
+    rules, _ = parse_css(CSS_COMMENT_RE.sub('', css))
+    return ''.join(_filter_rules(rules, used_selectors(sources)))
+
+
+# --- Prakompresi ---
+
+def compressed_siblings(path):
+    """
+    Path sibling prakompresi untuk sebuah file output (kosong jika tipe file tidak dikompresi).
+    """
+    if not path.endswith(COMPRESSIBLE_EXTENSIONS):
+        return []
+    siblings = [path + '.gz']
+    if brotli is not None:
+        siblings.append(path + '.br')
+    return siblings
+
+
+def write_compressed_siblings(path, data, status):
+    """
+    Menulis .gz/.br untuk data yang baru saja ditulis ke path. Jika file utama tidak berubah
+    dan siblingnya sudah ada, kompresi dilewati. Mengembalikan [(path sibling, status)].
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    results = []
+    if len(data) < MIN_COMPRESS_BYTES:
+        return results
+    for sibling in compressed_siblings(path):
+        if status == UNCHANGED and os.path.exists(sibling):
+            results.append((sibling, UNCHANGED))
+            continue
+        if sibling.endswith('.gz'):
+            # mtime=0 supaya file .gz deterministik
+            compressed = gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+        else:
+            compressed = brotli.compress(data, quality=BROTLI_QUALITY)
+        results.append((sibling, write_if_changed(sibling, compressed)))
+    return results
+
+
+class AssetPipeline:
+    """
+    Opsi tahap aset untuk satu build. Objek ini dikirim ke setiap worker render, jadi hanya
+    berisi data sederhana (bisa di-pickle).
+
+    critical_css_by_template: nama template -> CSS kritis yang di-inline (kosong = tidak di-inline).
+    """
+
+    def __init__(self, minify=False, precompress=False, critical_css_by_template=None):
+        self.minify = minify
+        self.precompress = precompress
+        self.critical_css_by_template = critical_css_by_template or {}
+
+    @classmethod
+    def for_templates(cls, template_dir, template_names, stylesheet_path, minify=False, precompress=False,
+                      inline_critical_css=False):
+        critical = {}
+        if inline_critical_css and os.path.exists(stylesheet_path):
+            with open(stylesheet_path, 'r', encoding='utf-8') as f:
+                css = f.read()
+            graph = TemplateGraph(template_dir)
+            critical = {name: critical_css(css, template_sources(template_dir, name, graph)) for name in template_names}
+        return cls(minify=minify, precompress=precompress, critical_css_by_template=critical)
+
+    @property
+    def enabled(self):
+        return bool(self.minify or self.precompress or self.critical_css_by_template)
+
+    def digest(self, template_name=None):
+        """
+        Sidik jari opsi aset, untuk dependensi halaman di build incremental.
+        Dengan template_name hanya CSS kritis template itu yang ikut dihitung.
+        """
+        h = hashlib.sha1(f"{self.minify}:{self.precompress}:{brotli is not None}".encode('utf-8'))
+        names = sorted(self.critical_css_by_template) if template_name is None else [template_name]
+        for name in names:
+            if name not in self.critical_css_by_template:
+                continue
+            h.update(name.encode('utf-8'))
+            h.update(self.critical_css_by_template[name].encode('utf-8'))
+        return h.hexdigest()
+
+    def transform_html(self, template_name, html):
+        css = self.critical_css_by_template.get(template_name)
+        if css:
+            # CSS kritis langsung di <head>; style.css lengkap dimuat tanpa memblokir render
+            html = STYLESHEET_LINK_RE.sub(
+                lambda _: (f'<style>{css}</style>'
+                           f'<link rel="preload" href="{STYLESHEET_HREF}" as="style" '
+                           f'onload="this.onload=null;this.rel=\'stylesheet\'">'
+                           f'<noscript><link rel="stylesheet" href="{STYLESHEET_HREF}"></noscript>'),
+                html, count=1)
+        if self.minify:
+            html = minify_html(html)
+        return html
+
+    def write(self, path, data):
+        """
+        Menulis file output (write-if-changed) beserta siblingnya. Mengembalikan [(path, status)].
+        """
+        status = write_if_changed(path, data)
+        return [(path, status)] + self.compress(path, data, status)
+
+    def compress(self, path, data, status):
+        """
+        Sibling prakompresi untuk data yang sudah ditulis ke path dengan status tulis status.
+        """
+        if not self.precompress:
+            return []
+        return write_compressed_siblings(path, data, status)
+
+    def siblings(self, path):
+        return compressed_siblings(path) if self.precompress else []
@@ -0,0 +1,192 @@
+# benchmarks/run_benchmarks.py
+# Benchmark build offline dengan feed Blogger sintetis (benchmarks/synthetic_feed.py).
+# Setiap ukuran blog dijalankan di subprocess tersendiri di folder sementara, supaya memori puncak
+# terukur bersih dan output tidak tercampur dengan isi repo. Hasilnya (laporan build per tahap)
+# dibandingkan dengan benchmarks/baseline.json. Baseline bergantung pada mesin: perbarui dengan
+# --update-baseline saat pindah mesin, dan bandingkan hanya run dari mesin yang sama.
+#
+# Contoh:
+#   python benchmarks/run_benchmarks.py                      # 1.000 dan 10.000 postingan
+#   python benchmarks/run_benchmarks.py --sizes 1000,10000,100000 --jobs 0
+#   python benchmarks/run_benchmarks.py --update-baseline
+import os
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCHMARK_DIR)
+DEFAULT_BASELINE_PATH = os.path.join(BENCHMARK_DIR, 'baseline.json')
+DEFAULT_SIZES = '1000,10000'
+DEFAULT_TOLERANCE = 0.25  # Regresi jika lebih lambat / lebih boros memori dari baseline lebih dari 25%
+MIN_STAGE_SECONDS = 0.5  # Tahap yang lebih cepat dari ini terlalu berisik untuk dibandingkan
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark build dengan feed Blogger sintetis.")
+    parser.add_argument('--sizes', default=DEFAULT_SIZES,
+                        help="Daftar jumlah postingan, dipisah koma (misal 1000,10000,100000).")
+    parser.add_argument('--words', type=int, default=400, help="Jumlah kata per postingan.")
+    parser.add_argument('--images', type=int, default=3, help="Jumlah gambar per postingan.")
+    parser.add_argument('--labels', type=int, default=50, help="Jumlah label unik di blog.")
+    parser.add_argument('--jobs', type=int, default=1, help="Diteruskan ke main.py --jobs.")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Ukur juga build kedua (incremental) tanpa perubahan di folder yang sama.")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE_PATH, help="Lokasi file baseline.")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="Toleransi regresi relatif terhadap baseline (0.25 = 25%%).")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="Tulis hasil run ini sebagai baseline baru.")
+    parser.add_argument('--keep', action='store_true', help="Jangan hapus folder output sementara.")
+    # Dipakai secara internal: menjalankan satu build di subprocess ini
+    parser.add_argument('--worker', type=int, default=None, help=argparse.SUPPRESS)
+    parser.add_argument('--build-args', default='', help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def run_worker(args):
+    """
+    Satu build di proses ini, dengan cwd = folder output. Laporan build ditulis oleh main.build.
+    """
+    sys.path.insert(0, REPO_DIR)
+    sys.path.insert(0, BENCHMARK_DIR)
+    import main as site_main
+    from synthetic_feed import SyntheticBlog
+
+    blog = SyntheticBlog(args.worker, words_per_post=args.words, images_per_post=args.images,
+                         label_count=args.labels)
+    os.environ.setdefault('BLOGGER_API_KEY', 'benchmark')
+    os.environ.setdefault('BLOG_ID', 'benchmark')
+    build_args = site_main.parse_args(args.build_args.split() + ['--quiet'])
+    site_main.build(build_args, fetch_page=blog.get_blogger_posts)
+
+
+def run_build(args, size, workdir):
+    report_path = os.path.join(workdir, '.build-cache', 'build-report.json')
+    if os.path.exists(report_path):
+        os.remove(report_path)
+    build_args = f"--jobs {args.jobs}" + (" --incremental" if args.incremental else "")
+    command = [sys.executable, os.path.abspath(__file__), '--worker', str(size),
+               '--words', str(args.words), '--images', str(args.images), '--labels', str(args.labels),
+               f'--build-args={build_args}']
+    completed = subprocess.run(command, cwd=workdir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    if completed.returncode != 0 or not os.path.exists(report_path):
+        # main.build menangkap error sendiri, jadi laporan yang tidak ada berarti build gagal
+        print(completed.stdout[-4000:])
+        raise RuntimeError(f"Build benchmark {size} postingan gagal.")
+    with open(report_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def summarize(report):
+    return {
+        'wall_seconds': report['wall_seconds'],
+        'peak_memory_bytes': report['peak_memory_bytes'],
+        'bytes_written': report['bytes_written'],
+        'stages': {
+            stage['name']: {
+                'wall_seconds': stage['wall_seconds'],
+                'items_per_second': stage.get('items_per_second'),
+                'peak_memory_bytes': stage.get('peak_memory_bytes'),
+            }
+            for stage in report['stages']
+        },
+    }
+
+
+def compare(name, result, baseline, tolerance):
+    """
+    Mengembalikan daftar pesan regresi untuk satu hasil dibanding baseline-nya.
+    """
+    regressions = []
+    limit = 1 + tolerance
+    checks = [('wall_seconds', result['wall_seconds'], baseline.get('wall_seconds')),
+              ('peak_memory_bytes', result['peak_memory_bytes'], baseline.get('peak_memory_bytes'))]
+    memory_reported = False
+    for stage_name, stage in result['stages'].items():
+        base_stage = baseline.get('stages', {}).get(stage_name)
+        if not base_stage:
+            continue
+        if base_stage['wall_seconds'] >= MIN_STAGE_SECONDS:
+            checks.append((f"{stage_name}.wall_seconds", stage['wall_seconds'], base_stage['wall_seconds']))
+        # Memori per tahap adalah puncak kumulatif: cukup laporkan tahap pertama yang melewati batas,
+        # tahap sesudahnya pasti ikut melewatinya
+        memory, base_memory = stage.get('peak_memory_bytes'), base_stage.get('peak_memory_bytes')
+        if not memory_reported and memory and base_memory and memory > base_memory * limit:
+            checks.append((f"{stage_name}.peak_memory_bytes", memory, base_memory))
+            memory_reported = True
+    for metric, value, base_value in checks:
+        if value and base_value and value > base_value * limit:
+            regressions.append(f"{name} {metric}: {value} (baseline {base_value}, +{value / base_value - 1:.0%})")
+    return regressions
+
+
+def print_result(name, result):
+    memory = result['peak_memory_bytes']
+    memory_text = f"{memory / 1024 / 1024:.1f} MB" if memory else "n/a"
+    print(f"\n{name}: {result['wall_seconds']:.2f} s, memori puncak {memory_text}, "
+          f"{result['bytes_written'] or 0} byte ditulis")
+    for stage_name, stage in result['stages'].items():
+        throughput = f"{stage['items_per_second']:>12.1f} item/s" if stage['items_per_second'] else ""
+        stage_memory = stage.get('peak_memory_bytes')
+        stage_memory_text = f"{stage_memory / 1024 / 1024:>7.1f} MB" if stage_memory else f"{'n/a':>10}"
+        print(f"  {stage_name:<18} {stage['wall_seconds']:>8.3f} s {stage_memory_text} {throughput}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.worker is not None:
+        run_worker(args)
+        return 0
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    results = {}
+    for size in sizes:
+        workdir = tempfile.mkdtemp(prefix=f'tantemagz-bench-{size}-')
+        try:
+            print(f"Benchmark {size} postingan di {workdir}...")
+            results[f"posts_{size}"] = summarize(run_build(args, size, workdir))
+            if args.incremental:
+                results[f"posts_{size}_incremental"] = summarize(run_build(args, size, workdir))
+        finally:
+            if not args.keep:
+                shutil.rmtree(workdir, ignore_errors=True)
+
+    for name, result in results.items():
+        print_result(name, result)
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"\nBaseline diperbarui: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nBaseline {args.baseline} belum ada; jalankan dengan --update-baseline.")
+        return 0
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = []
+    for name, result in results.items():
+        if name in baseline:
+            regressions.extend(compare(name, result, baseline[name], args.tolerance))
+    if regressions:
+        print("\nRegresi dibanding baseline:")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+    print("\nTidak ada regresi dibanding baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+# benchmarks/synthetic_feed.py
+# Generator respons Blogger API sintetis (bentuk `items` / `nextPageToken` yang sama dengan yang
+# dikonsumsi get_blogger_posts), supaya pipeline bisa dijalankan offline dengan ukuran blog apa pun.
+# Postingan dibuat secara deterministik per indeks, hanya untuk halaman yang diminta, jadi
+# feed 100k postingan tidak perlu disimpan seluruhnya di memori.
+import random
+from datetime import datetime, timedelta, timezone
+
+WORDS = ("cerita kisah malam itu aku dia kami mereka rumah kamar jalan kota desa pagi siang sore "
+         "hujan panas dingin teman kakak adik tetangga kantor sekolah pulang pergi datang lihat "
+         "dengar rasa senang sedih marah takut rindu cinta").split()
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class SyntheticBlog:
+    """
+    Blog sintetis dengan `post_count` postingan. Postingan indeks 0 adalah yang terbaru.
+
+    Args:
+        post_count (int): Jumlah postingan.
+        words_per_post (int): Perkiraan jumlah kata di body HTML tiap postingan.
+        images_per_post (int): Jumlah <img> Blogger di tiap postingan.
+        label_count (int): Kardinalitas label di seluruh blog.
+        labels_per_post (int): Maksimum label per postingan.
+        seed (int): Seed supaya feed selalu sama antar run.
+    """
+
+    def __init__(self, post_count, words_per_post=400, images_per_post=3, label_count=50,
+                 labels_per_post=3, seed=1):
+        self.post_count = post_count
+        self.words_per_post = words_per_post
+        self.images_per_post = images_per_post
+        self.labels = [f"Kategori {i}" for i in range(label_count)]
+        self.labels_per_post = min(labels_per_post, label_count)
+        self.seed = seed
+
+    def post(self, index):
+        rng = random.Random(self.seed * 1000003 + index)
+        published = BASE_TIME - timedelta(hours=3 * index)
+        updated = published + timedelta(minutes=rng.randint(0, 90))
+
+        paragraphs = []
+        remaining = self.words_per_post
+        while remaining > 0:
+            count = min(remaining, rng.randint(30, 80))
+            paragraphs.append("<p>" + " ".join(rng.choice(WORDS) for _ in range(count)) + "</p>")
+            remaining -= count
+        for image in range(self.images_per_post):
+            alt = '' if image % 2 else ' alt="gambar"'  # Sebagian gambar sengaja tanpa alt
+            position = rng.randint(0, len(paragraphs))
+            paragraphs.insert(position, (
+                '<div class="separator"><a href="https://blogger.googleusercontent.com/img/b/R29vZ2xl/'
+                f'AVvX{index}x{image}/s1600/gambar-{index}-{image}.jpg">'
+                '<img border="0" width="640" height="480" '
+                f'src="https://blogger.googleusercontent.com/img/b/R29vZ2xl/AVvX{index}x{image}/w640-h480/gambar-{index}-{image}.jpg"'
+                f'{alt}/></a></div>'
+            ))
+
+        item = {
+            'kind': 'blogger#post',
+            'id': str(9000000000000000000 + index),
+            'published': published.isoformat(),
+            'updated': updated.isoformat(),
+            'url': f"https://example.blogspot.com/{published:%Y/%m}/post-{index}.html",
+            'title': f"Cerita Sintetis Nomor {index}",
+            'content': "\n".join(paragraphs),
+        }
+        label_count = rng.randint(0, self.labels_per_post)
+        if label_count:
+            item['labels'] = rng.sample(self.labels, label_count)
+        return item
+
+    def get_blogger_posts(self, blog_id, api_key, max_results=10, page_token=None, order_by=None):
+        """
+        Pengganti get_blogger_posts dengan signature dan bentuk respons yang sama.
+        pageToken berisi offset; urutan 'updated' sama dengan urutan 'published' di feed ini.
+        """
+        start = int(page_token or 0)
+        end = min(start + max_results, self.post_count)
+        response = {
+            'kind': 'blogger#postList',
+            'items': [self.post(index) for index in range(start, end)],
+        }
+        if end < self.post_count:
+            response['nextPageToken'] = str(end)
+        return response
@@ -0,0 +1,155 @@
+# blogger_fetcher.py
+# Subsistem fetch Blogger API:
+#   - satu requests.Session dengan connection pool, jadi koneksi TLS dipakai ulang antar halaman,
+#   - timeout di setiap request,
+#   - retry dengan backoff eksponensial untuk error koneksi dan status 429/5xx (menghormati Retry-After),
+#   - generator halaman streaming yang mengambil halaman berikutnya di thread latar
+#     selagi halaman sekarang diproses.
+# Kegagalan selalu dilempar sebagai BloggerFetchError, tidak pernah dianggap "halaman terakhir",
+# supaya build tidak mem-publish situs dari daftar postingan yang terpotong.
+import os
+import queue
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# BLOGGER_API_BASE bisa diarahkan ke stand-in lokal (lihat api_recording.py serve)
+API_BASE = os.getenv('BLOGGER_API_BASE', 'https://www.googleapis.com').rstrip('/')
+API_URL = API_BASE + "/blogger/v3/blogs/{blog_id}/posts"
+DEFAULT_TIMEOUT = (10, 60)  # (connect, read) dalam detik
+DEFAULT_RETRIES = 5
+DEFAULT_BACKOFF = 1.0  # Jeda antar retry: 1, 2, 4, 8, ... detik
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+DEFAULT_PREFETCH = 1  # Jumlah halaman yang boleh menunggu diproses selagi halaman berikutnya diunduh
+
+_session = None
+
+
+class BloggerFetchError(RuntimeError):
+    pass
+
+
+def create_session(retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, pool_size=4):
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(['GET']),
+        respect_retry_after_header=True,
+        raise_on_status=False,  # Setelah retry habis, status error dilaporkan lewat raise_for_status
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_session():
+    """
+    Session bersama untuk seluruh proses (dibuat saat pertama dipakai).
+    """
+    global _session
+    if _session is None:
+        _session = create_session()
+    return _session
+
+
+def fetch_posts_page(blog_id, api_key, max_results=10, page_token=None, order_by=None,
+                     session=None, timeout=DEFAULT_TIMEOUT):
+    """
+    Mengambil satu halaman postingan. Mengembalikan respons JSON API, atau melempar
+    BloggerFetchError jika request tetap gagal setelah semua retry.
+    """
+    params = {
+        'key': api_key,
+        'fetchBodies': True,  # Pastikan konten postingan juga diambil
+        'maxResults': max_results
+    }
+    if page_token:
+        params['pageToken'] = page_token
+    if order_by:
+        params['orderBy'] = order_by
+
+    session = session or get_session()
+    try:
+        response = session.get(API_URL.format(blog_id=blog_id), params=params, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+    except requests.exceptions.HTTPError as e:
+        raise BloggerFetchError(f"Blogger API membalas HTTP {e.response.status_code}") from None
+    except (requests.exceptions.RequestException, ValueError) as e:
+        # Pesan error requests memuat URL lengkap; API key jangan sampai tercetak di log CI
+        message = str(e).replace(api_key, '***') if api_key else str(e)
+        raise BloggerFetchError(f"Gagal mengambil halaman dari Blogger API: {message}") from None
+
+
+def _fetch_pages(blog_id, api_key, max_results, order_by, fetch_page, first_page_size=None):
+    next_page_token = None
+    page_size = min(first_page_size or max_results, max_results)
+    while True:
+        posts_data = fetch_page(blog_id, api_key, max_results=page_size,
+                                page_token=next_page_token, order_by=order_by)
+        if posts_data is None:
+            # fetch_page bergaya get_blogger_posts mengembalikan None saat gagal
+            raise BloggerFetchError("Gagal mengambil halaman dari Blogger API.")
+        yield posts_data.get('items', [])
+        next_page_token = posts_data.get('nextPageToken')
+        if not next_page_token:
+            break
+        # Halaman berikutnya baru diminta jika pemanggil masih butuh: ukurannya digandakan sampai max_results
+        page_size = min(page_size * 2, max_results)
+
+
+def iter_pages(blog_id, api_key, max_results=500, order_by=None, fetch_page=None, prefetch=DEFAULT_PREFETCH,
+               first_page_size=None):
+    """
+    Generator daftar postingan per halaman API, urut sesuai respons.
+
+    Dengan prefetch > 0, halaman berikutnya diunduh di thread latar selagi pemanggil memproses
+    halaman sekarang. Menghentikan iterasi lebih awal (break) juga menghentikan thread tersebut.
+    fetch_page menggantikan fetch_posts_page (signature sama dengan get_blogger_posts),
+    misal untuk feed sintetis atau rekaman.
+    first_page_size: halaman pertama sekecil ini lalu ukurannya digandakan per halaman sampai max_results,
+    untuk pemanggil yang biasanya berhenti setelah beberapa postingan (delta fetch).
+    """
+    pages = _fetch_pages(blog_id, api_key, max_results, order_by, fetch_page or fetch_posts_page, first_page_size)
+    if not prefetch:
+        yield from pages
+        return
+
+    results = queue.Queue(maxsize=prefetch)
+    stopped = threading.Event()
+
+    def put(message):
+        while not stopped.is_set():
+            try:
+                results.put(message, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def producer():
+        try:
+            for items in pages:
+                if not put(('page', items)):
+                    return
+            put(('done', None))
+        except Exception as e:
+            put(('error', e))
+
+    thread = threading.Thread(target=producer, name='blogger-prefetch', daemon=True)
+    thread.start()
+    try:
+        while True:
+            kind, value = results.get()
+            if kind == 'page':
+                yield value
+            elif kind == 'error':
+                raise value
+            else:
+                break
+    finally:
+        stopped.set()
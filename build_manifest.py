@@ -0,0 +1,143 @@
+# build_manifest.py
+# Manifest build untuk mode incremental: menyimpan hash tiap postingan dan
+# "sidik jari" dependensi tiap halaman output, supaya build berikutnya cukup
+# me-render ulang halaman yang input-nya benar-benar berubah.
+import os
+import json
+import hashlib
+
+# Naikkan jika cara render/preprocessing berubah, supaya build berikutnya menjadi full rebuild
+MANIFEST_VERSION = 4
+DEFAULT_MANIFEST_PATH = os.path.join('.build-cache', 'manifest.json')
+
+
+def content_hash(text):
+    """
+    Mengembalikan hash sha1 (hex) dari sebuah string.
+    """
+    return hashlib.sha1((text or '').encode('utf-8')).hexdigest()
+
+
+def post_digest(post):
+    """
+    Digest untuk satu postingan mentah dari Blogger API.
+    Mencakup semua field yang dipakai template (judul, label, tanggal, konten),
+    sehingga halaman yang menampilkan postingan ini ikut berubah jika digest berubah.
+    """
+    payload = json.dumps([
+        post.get('id'),
+        post.get('updated'),
+        post.get('published'),
+        post.get('title'),
+        post.get('labels', []),
+        content_hash(post.get('content', '')),
+    ], ensure_ascii=False)
+    return content_hash(payload)
+
+
+def fingerprint(*parts):
+    """
+    Menggabungkan beberapa bagian dependensi (string/list/dict yang bisa di-JSON-kan)
+    menjadi satu sidik jari.
+    """
+    return content_hash(json.dumps(parts, ensure_ascii=False, sort_keys=True))
+
+
+class BuildManifest:
+    """
+    Manifest yang disimpan di disk antar build.
+
+    Struktur:
+        posts: {post_id: {'updated', 'hash', 'path', 'thumbnail_url', 'parsed_content'}}
+        pages: {output_path: fingerprint dependensi halaman itu}
+    """
+
+    def __init__(self, path=DEFAULT_MANIFEST_PATH):
+        self.path = path
+        self.posts = {}
+        self.pages = {}
+        self._seen_pages = set()
+        self.stale_paths = []
+        self.rendered = 0
+        self.skipped = 0
+
+    @classmethod
+    def load(cls, path=DEFAULT_MANIFEST_PATH):
+        manifest = cls(path)
+        if not os.path.exists(path):
+            return manifest
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Manifest build tidak bisa dibaca ({e}), melakukan full rebuild.")
+            return manifest
+        if data.get('version') != MANIFEST_VERSION:
+            return manifest
+        manifest.posts = data.get('posts', {})
+        manifest.pages = data.get('pages', {})
+        return manifest
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        # Buang halaman yang tidak lagi dihasilkan pada build ini
+        pages = {p: fp for p, fp in self.pages.items() if p in self._seen_pages}
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'posts': self.posts, 'pages': pages}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    # --- Postingan ---
+    def cached_post(self, post_id, digest):
+        """
+        Mengembalikan entri cache postingan jika digest-nya masih sama, selain itu None.
+        """
+        entry = self.posts.get(post_id)
+        if entry and entry.get('hash') == digest:
+            return entry
+        return None
+
+    def record_post(self, post, digest, output_path):
+        """
+        Menyimpan hasil preprocessing postingan. Jika postingan ini sebelumnya
+        ditulis ke path lain (misal judulnya diganti), path lama dicatat untuk dihapus.
+        """
+        previous = self.posts.get(post['id'], {}).get('path')
+        self.posts[post['id']] = {
+            'updated': post.get('updated'),
+            'hash': digest,
+            'path': output_path,
+            'thumbnail_url': post.get('thumbnail_url'),
+            'parsed_content': post.get('parsed_content'),
+        }
+        if previous and previous != output_path:
+            self.stale_paths.append(previous)
+
+    def prune_posts(self, live_post_ids):
+        """
+        Menghapus entri postingan yang sudah tidak ada di blog.
+        Mengembalikan daftar path output milik postingan yang terhapus.
+        """
+        removed = list(self.stale_paths)
+        for post_id in list(self.posts):
+            if post_id not in live_post_ids:
+                removed.append(self.posts.pop(post_id).get('path'))
+        live_paths = {entry.get('path') for entry in self.posts.values()}
+        return [p for p in removed if p and p not in live_paths]
+
+    # --- Halaman ---
+    def is_fresh(self, output_path, page_fingerprint, exists=True):
+        """
+        True jika halaman sudah ada di disk (exists) dan sidik jari dependensinya tidak berubah.
+        Sekaligus menandai halaman ini sebagai bagian dari build saat ini.
+        """
+        self._seen_pages.add(output_path)
+        fresh = exists and self.pages.get(output_path) == page_fingerprint
+        if fresh:
+            self.skipped += 1
+        return fresh
+
+    def record_page(self, output_path, page_fingerprint):
+        self._seen_pages.add(output_path)
+        self.pages[output_path] = page_fingerprint
+        self.rendered += 1
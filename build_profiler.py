@@ -0,0 +1,128 @@
+# build_profiler.py
+# Instrumentasi build: waktu wall/CPU, jumlah item, dan memori puncak per tahap, byte yang ditulis,
+# lalu semuanya disimpan sebagai laporan JSON.
+import os
+import sys
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+try:
+    import resource  # Tidak tersedia di Windows
+except ImportError:
+    resource = None
+
+DEFAULT_BUILD_REPORT_PATH = os.path.join('.build-cache', 'build-report.json')
+
+
+def peak_memory_bytes():
+    """
+    Memori puncak (max RSS) proses ini, atau None jika tidak bisa diukur di platform ini.
+    """
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KB, macOS melaporkan byte
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+class BuildProfiler:
+    """
+    Contoh pemakaian:
+        profiler.start('fetch')
+        ...
+        profiler.end(items=len(posts))
+
+    Pekerjaan yang berjalan di tengah tahap lain (misal parsing HTML di sela fetch) diukur dengan
+        with profiler.section('preprocess_html'):
+            ...
+    Waktunya dikurangkan dari tahap yang sedang berjalan dan ditambahkan ke tahap bernama sama.
+
+    Waktu CPU yang dicatat adalah milik proses utama; pada mode --jobs > 1 kerja worker
+    terlihat sebagai waktu wall, bukan CPU.
+
+    peak_memory_bytes sebuah tahap adalah max RSS proses utama sampai tahap itu selesai, jadi
+    tahap pertama yang nilainya melonjak adalah tahap yang menaikkan memori puncak build.
+    """
+
+    def __init__(self):
+        self.stages = []
+        self._current = None
+        self._sections = {}  # nama tahap -> [wall, cpu] dari section() yang belum masuk ke tahapnya
+        self._build_start = time.perf_counter()
+        self._build_cpu_start = time.process_time()
+
+    def start(self, name):
+        if self._current is not None:
+            self.end()
+        self._current = {
+            'name': name,
+            '_wall_start': time.perf_counter(),
+            '_cpu_start': time.process_time(),
+            '_excluded_wall': 0.0,
+            '_excluded_cpu': 0.0,
+        }
+
+    @contextmanager
+    def section(self, name):
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            totals = self._sections.setdefault(name, [0.0, 0.0])
+            totals[0] += wall
+            totals[1] += cpu
+            if self._current is not None and self._current['name'] != name:
+                self._current['_excluded_wall'] += wall
+                self._current['_excluded_cpu'] += cpu
+
+    def end(self, items=None):
+        stage = self._current
+        if stage is None:
+            return
+        self._current = None
+        wall = time.perf_counter() - stage.pop('_wall_start') - stage.pop('_excluded_wall')
+        cpu = time.process_time() - stage.pop('_cpu_start') - stage.pop('_excluded_cpu')
+        section_wall, section_cpu = self._sections.pop(stage['name'], (0.0, 0.0))
+        wall += section_wall
+        cpu += section_cpu
+        stage['wall_seconds'] = round(wall, 4)
+        stage['cpu_seconds'] = round(cpu, 4)
+        stage['items'] = items
+        if items and wall > 0:
+            stage['items_per_second'] = round(items / wall, 1)
+        stage['peak_memory_bytes'] = peak_memory_bytes()
+        self.stages.append(stage)
+
+    def report(self, bytes_written=None, extra=None):
+        if self._current is not None:
+            self.end()
+        report = {
+            'finished_at': datetime.now(timezone.utc).isoformat(),
+            'wall_seconds': round(time.perf_counter() - self._build_start, 4),
+            'cpu_seconds': round(time.process_time() - self._build_cpu_start, 4),
+            'peak_memory_bytes': peak_memory_bytes(),
+            'bytes_written': bytes_written,
+            'stages': self.stages,
+        }
+        if extra:
+            report.update(extra)
+        return report
+
+    def save(self, path=DEFAULT_BUILD_REPORT_PATH, bytes_written=None, extra=None):
+        report = self.report(bytes_written=bytes_written, extra=extra)
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+        print(f"Build selesai dalam {report['wall_seconds']:.2f} detik. Laporan build: {path}")
+        for stage in report['stages']:
+            items = f", {stage['items']} item" if stage['items'] is not None else ""
+            memory = stage['peak_memory_bytes']
+            memory = f" {memory / 1024 / 1024:>7.1f} MB" if memory else ""
+            print(f"  {stage['name']:<18} {stage['wall_seconds']:>8.3f} s wall {stage['cpu_seconds']:>8.3f} s cpu"
+                  f"{memory}{items}")
+        return report
@@ -0,0 +1,159 @@
+# dev_server.py
+# Server pengembangan: build sekali, sajikan hasilnya lewat HTTP lokal, lalu (dengan --watch)
+# build ulang setiap kali templates/ atau style.css berubah.
+#   python dev_server.py serve --watch [--port 8000] [argumen main.py lain, misal --jobs 4 --replay DIR]
+#
+# Respons Blogger API dari build pertama disimpan di memori, jadi build ulang tidak menyentuh network.
+# Build ulang selalu incremental dengan sidik jari per jenis halaman (lihat template_graph.py):
+# mengubah single_post_template.html hanya me-render ulang halaman postingan, custom_sidebar.html
+# me-render ulang semua halaman, dan perubahan style.css tanpa --critical-css tidak me-render apa pun.
+import os
+import sys
+import time
+import argparse
+import threading
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from urllib.parse import urlparse
+import main as site_main
+from api_recording import request_key
+from template_graph import TemplateGraph
+from renderer import PAGE_TEMPLATES
+from utils import get_blogger_posts
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_DIR = os.path.join(REPO_DIR, 'templates')
+STYLESHEET_PATH = os.path.join(REPO_DIR, 'style.css')
+DEFAULT_PORT = 8000
+DEFAULT_INTERVAL = 0.5  # Detik antar pemeriksaan perubahan file
+
+
+class MemoizedFetcher:
+    """
+    Pembungkus fetch_page (signature sama dengan get_blogger_posts) yang menyimpan setiap respons
+    sukses di memori. Respons gagal (None) tidak disimpan, jadi dicoba lagi di build berikutnya.
+    """
+
+    def __init__(self, fetch_page=None):
+        self.fetch_page = fetch_page or get_blogger_posts
+        self.pages = {}
+
+    def get_blogger_posts(self, blog_id, api_key, max_results=10, page_token=None, order_by=None):
+        key = request_key(max_results, page_token, order_by)
+        if key not in self.pages:
+            posts_data = self.fetch_page(blog_id, api_key, max_results=max_results, page_token=page_token,
+                                         order_by=order_by)
+            if posts_data is None:
+                return None
+            self.pages[key] = posts_data
+        return self.pages[key]
+
+
+def snapshot(template_dir=TEMPLATE_DIR, stylesheet_path=STYLESHEET_PATH):
+    """
+    path -> mtime untuk semua file yang diawasi.
+    """
+    paths = [os.path.join(template_dir, name) for name in sorted(os.listdir(template_dir))]
+    paths.append(stylesheet_path)
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+    return mtimes
+
+
+def changed_files(before, after):
+    return sorted(path for path in set(before) | set(after) if before.get(path) != after.get(path))
+
+
+def describe_changes(changed, template_dir=TEMPLATE_DIR, critical_css=False):
+    """
+    Ringkasan jenis halaman yang terdampak, untuk log di terminal.
+    """
+    template_names = [os.path.relpath(path, template_dir) for path in changed
+                      if os.path.dirname(path) == template_dir]
+    affected = TemplateGraph(template_dir).affected(template_names, PAGE_TEMPLATES)
+    if any(os.path.dirname(path) != template_dir for path in changed) and critical_css:
+        affected = list(PAGE_TEMPLATES)  # CSS kritis semua template ikut berubah
+    return ', '.join(affected) if affected else 'tidak ada (file disajikan langsung)'
+
+
+class DevRequestHandler(SimpleHTTPRequestHandler):
+    def end_headers(self):
+        # Selalu ambil versi terbaru dari disk setelah build ulang
+        self.send_header('Cache-Control', 'no-store')
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        print(f"{self.command} {urlparse(self.path).path} -> {args[1] if len(args) > 1 else ''}")
+
+
+def start_server(directory, host='127.0.0.1', port=DEFAULT_PORT):
+    """
+    Menyajikan directory lewat HTTP di thread latar. Mengembalikan server (panggil shutdown() untuk berhenti).
+    """
+    server = ThreadingHTTPServer((host, port), partial(DevRequestHandler, directory=directory))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Menyajikan {directory} di http://{host}:{server.server_port}/")
+    return server
+
+
+def rebuild(build_args, fetcher):
+    success = site_main.build(build_args, fetch_page=fetcher.get_blogger_posts)
+    if not success:
+        print("Build gagal; server tetap menyajikan hasil build terakhir.")
+    return success
+
+
+def serve(build_args, host='127.0.0.1', port=DEFAULT_PORT, watch=False, interval=DEFAULT_INTERVAL):
+    fetcher = MemoizedFetcher()
+    build_args.incremental = True
+    watched = snapshot()
+    rebuild(build_args, fetcher)
+    # Respons API sudah ada di memori; rekaman (jika diminta) cukup dibuat sekali
+    build_args.record = None
+
+    server = start_server(os.getcwd(), host, port)
+    try:
+        if not watch:
+            while True:
+                time.sleep(3600)
+        print(f"Mengawasi {TEMPLATE_DIR} dan {STYLESHEET_PATH} (Ctrl+C untuk berhenti)")
+        while True:
+            time.sleep(interval)
+            current = snapshot()
+            changed = changed_files(watched, current)
+            if not changed:
+                continue
+            watched = current
+            print(f"Berubah: {', '.join(os.path.relpath(path, REPO_DIR) for path in changed)}")
+            print(f"Halaman terdampak: {describe_changes(changed, critical_css=build_args.critical_css)}")
+            rebuild(build_args, fetcher)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Server pengembangan untuk situs statis.",
+                                     epilog="Argumen lain diteruskan ke main.py (misal --jobs 4 atau --replay DIR).")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    serve_parser = subparsers.add_parser('serve', help="Build, lalu sajikan hasilnya lewat HTTP lokal.")
+    serve_parser.add_argument('--watch', action='store_true',
+                              help="Build ulang (incremental, tanpa fetch ulang) saat templates/ atau style.css berubah.")
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    serve_parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL,
+                              help="Jeda (detik) antar pemeriksaan perubahan file.")
+    args, build_argv = parser.parse_known_args(argv)
+    if args.command == 'serve':
+        serve(site_main.parse_args(build_argv), args.host, args.port, args.watch, args.interval)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+# html_processor.py
+# Mesin pemrosesan HTML postingan dalam satu kali jalan (single pass).
+# Dalam satu tokenisasi streaming (html.parser bawaan Python, tanpa membangun tree) dihasilkan:
+#   - URL thumbnail dari gambar pertama,
+#   - teks preview N kata,
+#   - konten yang sudah dioptimasi (gambar responsif lewat image_rewriter, alt default).
+from html import escape, unescape
+from html.parser import HTMLParser
+from image_rewriter import resize_blogger_image_url, rewrite_img_attrs, ABOVE_FOLD_WORDS
+
+DEFAULT_IMAGE_ALT = 'Gambar Postingan'
+
+
+class PostHTMLProcessor(HTMLParser):
+    """
+    Tokenizer streaming yang menulis ulang HTML sambil mengumpulkan thumbnail dan teks preview.
+    Markup selain tag <img> diteruskan persis seperti di sumbernya (tag penutup, entity, komentar, CDATA).
+    """
+
+    def __init__(self, preview_words=30, thumbnail_size='s320', image_size='s800'):
+        super().__init__(convert_charrefs=False)
+        self.preview_words = preview_words
+        self.thumbnail_size = thumbnail_size
+        self.image_size = image_size
+
+        self.out = []
+        self.thumbnail_url = None
+        self._seen_first_img = False
+        self._words_before_first_img = 0  # Untuk menentukan apakah gambar pertama di atas lipatan
+        self._text_parts = []
+        self._preview_full = False  # True jika sudah terkumpul lebih dari preview_words kata
+        self._skip_text_depth = 0   # Di dalam <script>/<style>, teks tidak masuk preview
+        self._verbatim = None       # (posisi di out, masuk preview?) untuk token yang diisi di updatepos()
+
+    # --- Teks preview ---
+    def _add_text(self, text):
+        if self._skip_text_depth or self._preview_full:
+            return
+        self._text_parts.append(text)
+        # Pengumpulan berhenti setelah preview_words + 1 kata, jadi teks yang di-split tetap pendek
+        if len(''.join(self._text_parts).split()) > self.preview_words:
+            self._preview_full = True
+
+    def preview_text(self):
+        words = ''.join(self._text_parts).split()
+        preview = " ".join(words[:self.preview_words])
+        if len(words) > self.preview_words:
+            preview += "..."
+        return preview
+
+    # --- Tag ---
+    def _rewrite_img(self, attrs, self_closing):
+        attr_dict = dict(attrs)
+        first_img = not self._seen_first_img
+        if first_img:
+            self._seen_first_img = True
+            if attr_dict.get('src') is not None:
+                self.thumbnail_url = resize_blogger_image_url(attr_dict['src'], self.thumbnail_size)
+
+        if 'src' not in attr_dict:
+            self.out.append(self.get_starttag_text())
+            return
+
+        above_fold = first_img and self._words_before_first_img <= ABOVE_FOLD_WORDS
+        attrs = rewrite_img_attrs([list(a) for a in attrs], self.image_size, above_fold,
+                                  default_alt=DEFAULT_IMAGE_ALT)
+
+        parts = ['<img']
+        for name, value in attrs:
+            parts.append(f' {name}' if value is None else f' {name}="{escape(value, quote=True)}"')
+        parts.append('/>' if self_closing else '>')
+        self.out.append(''.join(parts))
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'img':
+            self._rewrite_img(attrs, self_closing=False)
+            return
+        if tag in ('script', 'style'):
+            self._skip_text_depth += 1
+        self.out.append(self.get_starttag_text())
+
+    def handle_startendtag(self, tag, attrs):
+        if tag == 'img':
+            self._rewrite_img(attrs, self_closing=True)
+            return
+        self.out.append(self.get_starttag_text())
+
+    def handle_endtag(self, tag):
+        if tag in ('script', 'style') and self._skip_text_depth:
+            self._skip_text_depth -= 1
+        self._append_verbatim()
+
+    # --- Data, entity, dan lainnya diteruskan apa adanya ---
+    def _append_verbatim(self, text=False):
+        """
+        Placeholder untuk token yang ditulis persis seperti di sumbernya. Handler HTMLParser hanya
+        menerima isi token (nama tag huruf kecil, nama entity tanpa tahu ada ';' atau tidak, isi CDATA
+        tanpa ']]>'), jadi teks aslinya diisi di updatepos(), yang dipanggil dengan rentang token itu.
+        text=True: hasil unescape token ikut masuk teks preview.
+        """
+        self._verbatim = (len(self.out), text)
+        self.out.append('')
+
+    def updatepos(self, i, j):
+        if self._verbatim is not None:
+            index, text = self._verbatim
+            self._verbatim = None
+            raw = self.rawdata[i:j]
+            self.out[index] = raw
+            if text:
+                self._add_text(unescape(raw))
+        return super().updatepos(i, j)
+
+    def close(self):
+        # '&nama' tanpa terminator di akhir konten tidak diteruskan utuh oleh HTMLParser (karakter '&' hilang)
+        rest = self.rawdata
+        if rest.startswith('&') and '<' not in rest and not self.cdata_elem:
+            self.rawdata = ''
+            self.out.append(rest)
+            self._add_text(unescape(rest))
+        super().close()
+
+    def handle_data(self, data):
+        self.out.append(data)
+        self._add_text(data)
+        if not self._seen_first_img and not self._skip_text_depth:
+            self._words_before_first_img += len(data.split())
+
+    def handle_entityref(self, name):
+        self._append_verbatim(text=True)
+
+    def handle_charref(self, name):
+        self._append_verbatim(text=True)
+
+    def handle_comment(self, data):
+        self._append_verbatim()
+
+    def handle_decl(self, decl):
+        self._append_verbatim()
+
+    def handle_pi(self, data):
+        self._append_verbatim()
+
+    def unknown_decl(self, data):
+        self._append_verbatim()
+
+
+def process_post_html(html_content, preview_words=30, thumbnail_size='s320', image_size='s800'):
+    """
+    Memproses HTML satu postingan dalam satu kali jalan.
+
+    Returns:
+        tuple: (thumbnail_url atau None, teks preview, konten yang sudah dioptimasi)
+    """
+    if not html_content:
+        return None, "", ""
+    processor = PostHTMLProcessor(preview_words=preview_words, thumbnail_size=thumbnail_size, image_size=image_size)
+    processor.feed(html_content)
+    processor.close()
+    return processor.thumbnail_url, processor.preview_text(), ''.join(processor.out)
@@ -0,0 +1,162 @@
+# image_rewriter.py
+# Penulisan ulang gambar Blogger untuk halaman postingan:
+#   - token ukuran di URL Blogger diganti sesuai kebutuhan, baik sebagai segmen path (/s1600/, /w640-h480/,
+#     /s1600-rw/) maupun sebagai akhiran URL img/a (=s1600, =w640-h480, =w640-h480-rw),
+#   - srcset/sizes dengan beberapa lebar, supaya pembaca mobile tidak mengunduh gambar 800px,
+#   - width/height intrinsik jika rasio gambar bisa diketahui (mencegah layout shift),
+#   - fetchpriority="high" untuk gambar pertama di atas lipatan, loading="lazy" hanya untuk sisanya.
+# Hasil penulisan ulang URL di-memo per proses, jadi URL yang sama hanya diproses sekali per build.
+import re
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+# Token ukuran Blogger, termasuk opsi tambahan seperti -rw atau -p-k-no-nu:
+# sebagai satu segmen path (/s1600/) atau sebagai akhiran URL img/a (...=s1600)
+SIZE_TOKEN = r'(s\d+|w\d+(?:-h\d+)?|h\d+)((?:-[a-z][a-z0-9-]*)?)'
+BLOGGER_SIZE_RE = re.compile(r'/' + SIZE_TOKEN + r'/')
+BLOGGER_SIZE_SUFFIX_RE = re.compile(r'=' + SIZE_TOKEN + r'(?=$|[?#])')
+BLOGGER_DIMENSIONS_RE = re.compile(r'w(\d+)-h(\d+)')
+BLOGGER_HOST_SUFFIXES = ('.googleusercontent.com', '.bp.blogspot.com', '.blogger.com')
+
+SRCSET_WIDTHS = (320, 480, 640, 800, 1200, 1600)
+MAX_IMAGE_WIDTH = 1600
+ABOVE_FOLD_WORDS = 120  # Gambar pertama setelah lebih dari N kata dianggap di bawah lipatan
+# Memo dibatasi supaya blog dengan puluhan ribu gambar unik tidak menahan semua string srcset di memori
+URL_MEMO_SIZE = 8192
+IMAGE_MEMO_SIZE = 2048
+
+
+def is_blogger_image(url):
+    host = urlsplit(url if '://' in url else 'https:' + url).hostname or ''
+    return host.endswith(BLOGGER_HOST_SUFFIXES)
+
+
+@lru_cache(maxsize=URL_MEMO_SIZE)
+def split_blogger_image_url(img_url):
+    """
+    Memecah URL gambar Blogger di sekitar token ukurannya:
+    (bagian sebelum termasuk '/' atau '=', token ukuran, opsi seperti -rw, bagian sesudah).
+    Mengembalikan None jika bukan URL gambar Blogger dengan token ukuran.
+    """
+    if not img_url or not is_blogger_image(img_url):
+        return None
+    match = BLOGGER_SIZE_RE.search(img_url)
+    if match is not None:
+        return (img_url[:match.start() + 1], match.group(1), match.group(2), img_url[match.end() - 1:])
+    match = BLOGGER_SIZE_SUFFIX_RE.search(img_url)
+    if match is not None:
+        return img_url[:match.start() + 1], match.group(1), match.group(2), img_url[match.end():]
+    return None
+
+
+def _with_size(parts, size):
+    head, _, options, tail = parts
+    return f"{head}{size}{options}{tail}"
+
+
+def resize_blogger_image_url(img_url, size):
+    """
+    Mengganti token ukuran Blogger (misal /s1600/ atau /w640-h480/) dengan ukuran yang diminta.
+    Opsi setelah ukuran (misal -rw untuk WebP) dipertahankan. URL selain gambar Blogger dikembalikan apa adanya.
+    """
+    parts = split_blogger_image_url(img_url)
+    return img_url if parts is None else _with_size(parts, size)
+
+
+def _int_attr(value):
+    try:
+        number = int(str(value).strip().removesuffix('px'))
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+
+def size_width(size):
+    """
+    Lebar dalam piksel dari token ukuran seperti 's800' atau 'w800-h600'.
+    """
+    match = re.match(r'[sw](\d+)', size or '')
+    return int(match.group(1)) if match else None
+
+
+@lru_cache(maxsize=IMAGE_MEMO_SIZE)
+def responsive_image(src, image_size, width=None, height=None, original_width=None, original_height=None):
+    """
+    Menghitung atribut gambar responsif untuk satu gambar Blogger.
+
+    width/height adalah atribut yang ditulis penulis (boleh None); original_* berasal dari
+    data-original-width/height Blogger. Mengembalikan dict atribut (src, srcset, sizes, dan
+    width/height jika bisa diturunkan), atau None jika src bukan gambar Blogger.
+    """
+    parts = split_blogger_image_url(src)
+    if parts is None:
+        return None
+
+    # Rasio dari dimensi asli, atribut penulis, atau token w-h di URL (urutan prioritas)
+    aspect = None
+    for w, h in ((original_width, original_height), (width, height)):
+        if w and h:
+            aspect = (w, h)
+            break
+    if aspect is None:
+        match = BLOGGER_DIMENSIONS_RE.fullmatch(parts[1])
+        if match:
+            aspect = (int(match.group(1)), int(match.group(2)))
+
+    display_width = width or size_width(image_size) or SRCSET_WIDTHS[-1]
+    display_width = min(display_width, size_width(image_size) or display_width)
+    max_width = min(original_width or MAX_IMAGE_WIDTH, MAX_IMAGE_WIDTH)
+    display_width = min(display_width, max_width)
+
+    def token(w):
+        # Dengan rasio yang diketahui dipakai w-h (dimensi pasti); tanpa rasio hanya lebar
+        if aspect:
+            return f"w{w}-h{round(w * aspect[1] / aspect[0])}"
+        return f"w{w}"
+
+    widths = [w for w in SRCSET_WIDTHS if w < display_width]
+    widths.append(display_width)
+    widths.extend(w for w in SRCSET_WIDTHS if display_width < w <= min(2 * display_width, max_width))
+
+    attrs = {
+        'src': _with_size(parts, token(display_width) if aspect else image_size),
+        'srcset': ', '.join(f"{_with_size(parts, token(w))} {w}w" for w in widths),
+        'sizes': f"(max-width: {display_width}px) 100vw, {display_width}px",
+    }
+    if aspect:
+        attrs['width'] = str(display_width)
+        attrs['height'] = str(round(display_width * aspect[1] / aspect[0]))
+    return attrs
+
+
+def rewrite_img_attrs(attrs, image_size, above_fold, default_alt=None):
+    """
+    Menulis ulang daftar atribut <img> (list of [nama, nilai], urutan dipertahankan).
+    """
+    attr_dict = {name: value for name, value in attrs}
+    src = attr_dict.get('src') or ''
+    new_attrs = responsive_image(
+        src, image_size,
+        _int_attr(attr_dict.get('width')), _int_attr(attr_dict.get('height')),
+        _int_attr(attr_dict.get('data-original-width')), _int_attr(attr_dict.get('data-original-height')),
+    )
+    if new_attrs is None:
+        new_attrs = {'src': resize_blogger_image_url(src, image_size)}
+    else:
+        new_attrs = dict(new_attrs)
+
+    if above_fold:
+        # Gambar LCP: unduh secepatnya, jangan lazy
+        new_attrs['fetchpriority'] = 'high'
+        new_attrs['loading'] = 'eager'
+    else:
+        new_attrs['loading'] = 'lazy'
+        new_attrs['decoding'] = 'async'
+    if default_alt and not (attr_dict.get('alt') or '').strip():
+        new_attrs['alt'] = default_alt
+
+    for attr in attrs:
+        if attr[0] in new_attrs:
+            attr[1] = new_attrs.pop(attr[0])
+    attrs.extend([name, value] for name, value in new_attrs.items())
+    return attrs
@@ -1,198 +1,285 @@
 import os
-import re
-import math
-from utils import get_secret, get_blogger_posts
-from jinja2 import Environment, FileSystemLoader
-from bs4 import BeautifulSoup
+import sys
+import glob
+import argparse
+import cProfile
+from utils import get_secret, get_blogger_posts, slugify
+from blogger_fetcher import iter_pages, BloggerFetchError
+from api_recording import Recorder, Replayer
+from build_manifest import BuildManifest, DEFAULT_MANIFEST_PATH, post_digest, fingerprint
+from template_graph import TemplateGraph
+from html_processor import process_post_html
+from post_store import PostStore, DEFAULT_STORE_PATH, DEFAULT_FULL_SYNC_DAYS, sync_posts
+from post_record import PostRecord, ContentSpool
+from related_posts import compute_related_posts
+from site_model import SiteModel
+from sitemap_writer import SitemapWriter
+from output_writer import OutputWriter, DEFAULT_REPORT_PATH
+from build_profiler import BuildProfiler, DEFAULT_BUILD_REPORT_PATH
+from search_index import (build_search_index, keep_search_index, SEARCH_DIR,
+                          INDEX_FILENAME as SEARCH_INDEX_FILENAME, INDEX_VERSION as SEARCH_INDEX_VERSION)
+from asset_pipeline import AssetPipeline
+from service_worker import build_service_worker, SERVICE_WORKER_FILENAME
+from renderer import PageRenderer, compact_post, LISTING_FIELDS, RELATED_FIELDS, RECENT_FIELDS, PAGE_TEMPLATES
 from datetime import datetime
 
 # --- Fungsi Pembantu (Sama seperti sebelumnya) ---
-def slugify(text):
-    text = str(text).lower()
-    text = re.sub(r'[^a-z0-9\s-]', '', text)
-    text = re.sub(r'[\s_-]+', '-', text)
-    text = re.sub(r'^-+', '', text)
-    text = re.sub(r'-+$', '', text)
-    return text
-
-def parse_html_content_preview(html_content, num_words=30):
-    if not html_content:
-        return ""
-    
-    soup = BeautifulSoup(html_content, 'html.parser')
-    for script in soup(["script", "style"]):
-        script.extract()
-    text = soup.get_text()
-    words = text.split()
-    truncated_words = words[:num_words]
-    preview_text = " ".join(truncated_words)
-    if len(words) > num_words:
-        preview_text += "..."
-    return preview_text
-
-def get_first_image_url(html_content, size='s320'):
-    if not html_content:
-        return None
-    soup = BeautifulSoup(html_content, 'html.parser')
-    first_img = soup.find('img')
-    if first_img and 'src' in first_img.attrs:
-        img_url = first_img['src']
-        optimized_url = re.sub(r'/(s\d+|w\d+-h\d+)/', f'/{size}/', img_url)
-        return optimized_url
-    return None
-
 def optimize_blogger_images_in_content(html_content, default_size='s800'):
-    if not html_content:
-        return ""
-    soup = BeautifulSoup(html_content, 'html.parser')
-    for img_tag in soup.find_all('img'):
-        if 'src' in img_tag.attrs:
-            img_url = img_tag['src']
-            optimized_url = re.sub(r'/(s\d+|w\d+-h\d+)/', f'/{default_size}/', img_url)
-            img_tag['src'] = optimized_url
-            img_tag['loading'] = 'lazy'  
-            if not img_tag.get('alt', '').strip():
-                img_tag['alt'] = 'Gambar Postingan'  
-    return str(soup)
+    return process_post_html(html_content, image_size=default_size)[2]
 
 # --- Fungsi untuk Generate Sitemap ---
-def generate_sitemap(processed_posts, all_labels, total_main_pages, posts_per_main_page, posts_by_label, base_url="https://www.yourdomain.com"):
+def generate_sitemap(site, base_url="https://www.yourdomain.com", output_dir=None, gzip_output=True, output=None):
     """
-    Menghasilkan sitemap.xml yang valid untuk Google Search Console dari postingan dan halaman yang diproses.
+    Menghasilkan sitemap yang valid untuk Google Search Console dari postingan dan halaman yang diproses.
+    Entri ditulis secara streaming ke sitemap-N.xml(.gz) (dipecah sesuai batas 50.000 URL / 50 MB)
+    dan didaftarkan di sitemap_index.xml.
 
     Args:
-        processed_posts (list): Daftar dictionary, di mana setiap dictionary mewakili postingan yang telah diproses sepenuhnya.
-        all_labels (set): Set semua label/kategori unik.
-        total_main_pages (int): Total jumlah halaman indeks utama yang dipaginasi.
-        posts_per_main_page (int): Jumlah postingan per halaman indeks utama.
-        posts_by_label (dict): Dictionary yang memetakan slug label ke informasi dan postingannya.
+        site (SiteModel): Model situs berisi postingan terurut, tanggal yang sudah di-parse,
+                          dan paginasi index/kategori (sama dengan yang dipakai saat membuat halaman).
         base_url (str): URL dasar situs web Anda (misalnya, "https://www.yourdomain.com").
                         Penting untuk URL absolut dalam sitemap.
+        output_dir (str): Direktori output (default: direktori kerja saat ini).
+        gzip_output (bool): Tulis shard sebagai .xml.gz.
+        output (OutputWriter): Lapisan output (write-if-changed); default dibuat baru untuk output_dir.
     """
-    print("Menghasilkan sitemap.xml...")
-    sitemap_entries = []
+    print("Menghasilkan sitemap...")
+    output_dir = output_dir or os.getcwd()
+    output = output or OutputWriter(output_dir)
+    writer = SitemapWriter(output_dir, base_url, gzip_output=gzip_output, output=output)
 
     # 1. Tambahkan URL postingan individual
-    for post in processed_posts:
+    for post in site.posts:
         loc = f"{base_url}/{slugify(post.get('title', 'untitled-post'))}.html"
-        lastmod = post.get('updated', post.get('published'))
-        if lastmod:
-            try:
-                # Periksa apakah lastmod adalah string sebelum mencoba memformat
-                if isinstance(lastmod, str):
-                    lastmod = datetime.fromisoformat(lastmod.replace('Z', '+00:00')).strftime('%Y-%m-%d')
-                else:
-                    lastmod = None # Tangani jika bukan string atau format tidak dikenal
-            except ValueError:
-                lastmod = None
-
-        sitemap_entries.append({
-            'loc': loc,
-            'lastmod': lastmod,
-            'changefreq': 'weekly', # Sesuaikan sesuai kebutuhan (misalnya, daily, weekly, monthly)
-            'priority': '0.8' # Sesuaikan prioritas (0.0 hingga 1.0)
-        })
+        # Sesuaikan changefreq (daily, weekly, monthly) dan prioritas (0.0 hingga 1.0) sesuai kebutuhan
+        writer.add(loc, site.lastmod([post]), 'weekly', '0.8')
 
     # 2. Tambahkan indeks utama dan halaman berpaginasi
-    for page_num in range(1, total_main_pages + 1):
+    # lastmod tiap halaman = perubahan terakhir dari postingan yang tampil di halaman itu
+    for page_num, page_posts in enumerate(site.index_pages, start=1):
         if page_num == 1:
             loc = base_url + "/"
         else:
             loc = f"{base_url}/pages/{page_num}.html"
-
-        # Gunakan tanggal terbit postingan terbaru sebagai lastmod untuk halaman indeks/paginasi utama
-        last_modified_main_page = None
-        if processed_posts: # Pastikan ada postingan yang diproses
-            last_modified_main_page = datetime.fromisoformat(processed_posts[0]['published'].replace('Z', '+00:00')).strftime('%Y-%m-%d')
-
-        sitemap_entries.append({
-            'loc': loc,
-            'lastmod': last_modified_main_page or datetime.now().strftime('%Y-%m-%d'),
-            'changefreq': 'daily',
-            'priority': '1.0' if page_num == 1 else '0.7'
-        })
+        writer.add(loc, site.lastmod(page_posts), 'daily', '1.0' if page_num == 1 else '0.7')
 
     # 3. Tambahkan halaman kategori (utama dan berpaginasi)
-    posts_per_category_page = 5 # Sama seperti yang digunakan dalam logika pembuatan halaman
-
-    for label_slug, label_info in posts_by_label.items():
-        category_posts = sorted(label_info['posts'], key=lambda p: datetime.fromisoformat(p['published'].replace('Z', '+00:00')), reverse=True)
-        total_category_posts = len(category_posts)
-        total_category_pages = math.ceil(total_category_posts / posts_per_category_page)
-
-        for page_num in range(1, total_category_pages + 1):
+    for label_slug, label_info in site.posts_by_label.items():
+        for page_num, page_posts in enumerate(label_info['pages'], start=1):
             if page_num == 1:
                 loc = f"{base_url}/kategori/{label_slug}.html"
             else:
                 loc = f"{base_url}/kategori/{label_slug}/page/{page_num}.html"
-
-            # Gunakan tanggal terbit postingan terbaru dalam kategori itu untuk lastmod
-            last_modified_category_page = None
-            if category_posts:
-                last_modified_category_page = datetime.fromisoformat(category_posts[0]['published'].replace('Z', '+00:00')).strftime('%Y-%m-%d')
-
-            sitemap_entries.append({
-                'loc': loc,
-                'lastmod': last_modified_category_page or datetime.now().strftime('%Y-%m-%d'),
-                'changefreq': 'weekly',
-                'priority': '0.7' if page_num == 1 else '0.5'
-            })
-
-    # Struktur XML untuk sitemap
-    sitemap_xml_template = """<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-{urls}
-</urlset>"""
-
-    url_entry_template = """    <url>
-        <loc>{loc}</loc>
-        {lastmod_tag}
-        <changefreq>{changefreq}</changefreq>
-        <priority>{priority}</priority>
-    </url>"""
-
-    url_entries_str = []
-    for entry in sitemap_entries:
-        lastmod_tag = f"<lastmod>{entry['lastmod']}</lastmod>" if entry['lastmod'] else ""
-        url_entries_str.append(url_entry_template.format(
-            loc=entry['loc'],
-            lastmod_tag=lastmod_tag,
-            changefreq=entry['changefreq'],
-            priority=entry['priority']
-        ))
-
-    final_sitemap_xml = sitemap_xml_template.format(urls="\n".join(url_entries_str))
-
-    # Simpan sitemap.xml ke direktori output root
-    sitemap_file_path = os.path.join(os.getcwd(), 'sitemap.xml')
-    with open(sitemap_file_path, "w", encoding="utf-8") as f:
-        f.write(final_sitemap_xml)
-    print(f"Sitemap berhasil dibuat di: {sitemap_file_path}")
+            writer.add(loc, site.lastmod(page_posts), 'weekly', '0.7' if page_num == 1 else '0.5')
+
+    sitemap_index_path = writer.close()
+
+    # sitemap.xml tetap ditulis (isinya sitemap index yang sama) karena URL ini
+    # sudah terdaftar di Google Search Console
+    output.write(os.path.join(output_dir, 'sitemap.xml'), writer.index_xml())
+    print(f"Sitemap berhasil dibuat di: {sitemap_index_path} ({writer.total_urls} URL, {len(writer.shards)} file)")
+    return writer.total_urls
+
+# --- Argumen Command Line ---
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate situs statis dari postingan Blogger.")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Hanya render ulang halaman yang dependensinya berubah sejak build terakhir.")
+    parser.add_argument('--manifest', default=DEFAULT_MANIFEST_PATH,
+                        help="Lokasi manifest build untuk mode incremental.")
+    parser.add_argument('--delta', action='store_true',
+                        help="Ambil hanya postingan yang berubah sejak sinkronisasi terakhir, memakai post store lokal.")
+    parser.add_argument('--store', default=DEFAULT_STORE_PATH,
+                        help="Lokasi post store lokal untuk mode --delta.")
+    parser.add_argument('--full-sync', action='store_true',
+                        help="Paksa sinkronisasi penuh post store (mendeteksi postingan yang dihapus).")
+    parser.add_argument('--full-sync-days', type=int, default=DEFAULT_FULL_SYNC_DAYS,
+                        help="Sinkronisasi penuh otomatis jika yang terakhir sudah lebih lama dari N hari.")
+    parser.add_argument('--record', default=None, metavar='DIR',
+                        help="Simpan setiap respons mentah Blogger API ke folder ini untuk di-replay nanti.")
+    parser.add_argument('--replay', default=None, metavar='DIR',
+                        help="Build dari rekaman di folder ini, tanpa network dan tanpa BLOGGER_API_KEY/BLOG_ID.")
+    parser.add_argument('--jobs', type=int, default=1,
+                        help="Jumlah proses worker untuk preprocessing HTML dan render template (0 = semua core).")
+    parser.add_argument('--stream-posts', action='store_true',
+                        help="Hemat memori untuk blog besar: HTML postingan disimpan sementara di disk dan "
+                             "dibaca kembali satu per satu saat halaman postingan di-render.")
+    parser.add_argument('--minify', action='store_true',
+                        help="Minifikasi HTML hasil render (isi <pre>, <script>, dan <style> tidak disentuh).")
+    parser.add_argument('--critical-css', action='store_true',
+                        help="Inline CSS kritis per jenis template dan muat style.css tanpa memblokir render.")
+    parser.add_argument('--precompress', action='store_true',
+                        help="Tulis sibling .gz (dan .br jika modul brotli terpasang) untuk setiap file output.")
+    parser.add_argument('--service-worker', action='store_true',
+                        help=f"Tulis {SERVICE_WORKER_FILENAME} (precache aset shell dan postingan terbaru, "
+                             "stale-while-revalidate untuk halaman lain) dan daftarkan di setiap halaman.")
+    parser.add_argument('--no-sitemap-gzip', dest='sitemap_gzip', action='store_false',
+                        help="Tulis shard sitemap sebagai .xml biasa, bukan .xml.gz.")
+    parser.add_argument('--change-report', default=DEFAULT_REPORT_PATH,
+                        help="Lokasi laporan JSON berisi file yang ditambahkan, berubah, dan dihapus.")
+    parser.add_argument('--build-report', default=DEFAULT_BUILD_REPORT_PATH,
+                        help="Lokasi laporan JSON berisi waktu, jumlah item, memori, dan byte per tahap build.")
+    parser.add_argument('--profile-output', default=None,
+                        help="Jika diisi, jalankan build di bawah cProfile dan simpan statistiknya ke file ini.")
+    parser.add_argument('--quiet', action='store_true',
+                        help="Jangan cetak log untuk setiap file yang dihasilkan.")
+    return parser.parse_args(argv)
 
 # --- Fungsi Utama ---
-def main():
+def main(argv=None):
+    args = parse_args(argv)
+    if args.profile_output:
+        profile = cProfile.Profile()
+        success = profile.runcall(build, args)
+        profile.dump_stats(args.profile_output)
+        print(f"cProfile stats disimpan di: {args.profile_output}")
+    else:
+        success = build(args)
+    # Exit code non-zero supaya CI tidak men-deploy hasil build yang gagal
+    if not success:
+        sys.exit(1)
+
+def build(args, fetch_page=None):
+    """
+    Menjalankan seluruh build. fetch_page (signature sama dengan get_blogger_posts) bisa diisi
+    sumber lain, misal feed sintetis untuk benchmark; default-nya Blogger API.
+    Mengembalikan True jika build selesai dan semua file sudah ditulis.
+    """
+    profiler = BuildProfiler()
     try:
-        blogger_api_key = get_secret("BLOGGER_API_KEY")
-        blog_id = get_secret("BLOG_ID")
-
-        print("Fetching ALL Blogger posts...")
-        all_posts_raw = [] # Mengubah nama variabel agar lebih jelas
-        next_page_token = None
-        while True:
-            posts_data = get_blogger_posts(blog_id, blogger_api_key, max_results=500, page_token=next_page_token)  
-            if posts_data and 'items' in posts_data:
-                for post_item in posts_data['items']:
-                    if 'content' in post_item:
-                        all_posts_raw.append(post_item)
-                next_page_token = posts_data.get('nextPageToken')
-                if not next_page_token:
-                    break
-            else:
-                break
-        
-        if all_posts_raw: # Menggunakan all_posts_raw
-            output_dir = os.getcwd()  
-            os.makedirs(output_dir, exist_ok=True)  
+        if args.replay:
+            # Replay tidak membutuhkan network maupun API key
+            replayer = Replayer(args.replay)
+            fetch_page = replayer.get_blogger_posts
+            blogger_api_key = os.getenv("BLOGGER_API_KEY", "")
+            blog_id = os.getenv("BLOG_ID") or replayer.blog_id
+        else:
+            blogger_api_key = get_secret("BLOGGER_API_KEY")
+            blog_id = get_secret("BLOG_ID")
+            if args.record:
+                fetch_page = Recorder(args.record, fetch_page or get_blogger_posts).get_blogger_posts
+                print(f"Merekam respons Blogger API ke: {args.record}")
+
+        output_dir = os.getcwd()
+        template_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+        if not os.path.isdir(template_dir):
+            raise FileNotFoundError(f"Template directory not found: {template_dir}")
+
+        # Environment Jinja (beserta filter slugify/date_format) dibuat di renderer,
+        # sekali di proses utama dan sekali di tiap worker jika --jobs > 1
+        # Semua file output ditulis lewat lapisan write-if-changed (atomik) yang mencatat perubahan
+        # Tahap aset opsional berjalan saat setiap file ditulis (termasuk di worker), bukan sebagai pass kedua
+        assets = AssetPipeline.for_templates(
+            template_dir, PAGE_TEMPLATES, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'style.css'),
+            minify=args.minify, precompress=args.precompress, inline_critical_css=args.critical_css
+        )
+        output = OutputWriter(output_dir, assets=assets if assets.enabled else None)
+        renderer = PageRenderer(template_dir, jobs=args.jobs, output=output, quiet=args.quiet, assets=assets,
+                                stream=args.stream_posts)
+        if renderer.jobs > 1:
+            print(f"Parallel build: {renderer.jobs} worker processes")
+
+        # --- MODE INCREMENTAL: MUAT MANIFEST BUILD SEBELUMNYA ---
+        # manifest = None berarti full rebuild (perilaku default)
+        manifest = BuildManifest.load(args.manifest) if args.incremental else None
+        post_digests = {}  # post id -> digest, dipakai untuk sidik jari dependensi halaman
+
+        def is_fresh(file_path, page_fingerprint):
+            if manifest is None:
+                return False
+            fresh = manifest.is_fresh(os.path.relpath(file_path, output_dir), page_fingerprint,
+                                      exists=os.path.exists(file_path))
+            if fresh:
+                output.keep(file_path)
+            return fresh
+
+        def record_page(file_path, page_fingerprint):
+            if manifest is not None:
+                manifest.record_page(os.path.relpath(file_path, output_dir), page_fingerprint)
+
+        # --- FETCH + PRE-PROCESS POSTINGAN SECARA STREAMING ---
+        # Setiap halaman API langsung di-preprocess begitu tiba, selagi halaman berikutnya diunduh
+        # di thread latar. Dengan --jobs > 1 parsing HTML juga berjalan di worker sambil fetch berlanjut.
+        profiler.start('fetch')
+        if args.delta:
+            print("Syncing Blogger posts with the local post store...")
+            store = PostStore.load(args.store)
+            try:
+                sync_posts(store, blog_id, blogger_api_key, max_results=500, full=args.full_sync,
+                           full_sync_days=args.full_sync_days, fetch_page=fetch_page)
+            except RuntimeError as e:
+                # Jangan publish situs dari data yang terpotong: pakai isi store terakhir yang utuh
+                print(f"Sinkronisasi gagal ({e}), memakai post store yang ada.")
+            # Store dikosongkan halaman demi halaman oleh loop di bawah, tidak ditahan sampai akhir build
+            post_pages = store.drain_pages(500)
+            del store
+        else:
+            print("Fetching ALL Blogger posts...")
+            post_pages = iter_pages(blog_id, blogger_api_key, max_results=500, fetch_page=fetch_page)
+
+        # Postingan disimpan sebagai PostRecord ringkas; dict mentah dari API dilepas setelah tiap halaman API.
+        # HTML penuh (hasil optimasi) disimpan di record sampai halaman postingannya di-render,
+        # atau di file sementara di disk dengan --stream-posts.
+        spool = ContentSpool() if args.stream_posts else None
+        processed_posts = []
+        processed_html = []  # (record, iterator hasil parsing) per halaman API yang masih dikerjakan
+        parsed_count = 0
+
+        def collect_parsed(page_posts, results):
+            for post, (thumbnail_url, parsed_content, optimized_content) in zip(page_posts, results):
+                post.thumbnail_url = thumbnail_url
+                post.parsed_content = parsed_content
+                post.store_content(optimized_content, optimized=True, spool=spool)
+            return len(page_posts)
+
+        try:
+            for items in post_pages:
+                page_to_process = []
+                page_contents = []
+                for post_item in items:
+                    if 'content' not in post_item:
+                        continue
+
+                    post_slug = slugify(post_item.get('title', 'untitled-post'))
+                    # Gunakan 'id' atau 'url' dari Blogger jika ada untuk detail_url yang lebih stabil
+                    # Atau tetap pakai slug jika Anda ingin URL statis
+                    # detail_url = post_item.get('url') # Jika ingin pakai URL asli Blogger
+                    post = PostRecord.from_post(post_item, detail_url=f"/{post_slug}.html") # Slug sebagai URL file lokal
+
+                    digest = post_digest(post_item)
+                    post_digests[post['id']] = digest
+                    cached_post = manifest.cached_post(post['id'], digest) if manifest is not None else None
+                    if cached_post:
+                        # Konten tidak berubah: pakai hasil parsing build sebelumnya.
+                        # optimized_content baru dihitung jika halaman postingan memang perlu di-render ulang.
+                        post.thumbnail_url = cached_post.get('thumbnail_url')
+                        post.parsed_content = cached_post.get('parsed_content')
+                        post.store_content(post_item.get('content', ''), optimized=False, spool=spool)
+                    else:
+                        page_to_process.append(post)
+                        page_contents.append(post_item.get('content', ''))
+                    processed_posts.append(post)
+
+                # Satu kali parsing per postingan menghasilkan thumbnail, preview, dan konten yang dioptimasi sekaligus.
+                # Waktu parsing (serial) dan menunggu hasil worker masuk ke tahap preprocess_html, bukan fetch.
+                with profiler.section('preprocess_html'):
+                    processed_html.append((page_to_process, renderer.submit_html(
+                        page_contents, preview_words=13, thumbnail_size='s320', image_size='s800'
+                    )))
+                    # Hasil halaman API sebelumnya diambil sekarang (halaman terbaru tetap dikerjakan di worker),
+                    # jadi hasil parsing yang menunggu di memori paling banyak dua halaman API
+                    while len(processed_html) > 1:
+                        parsed_count += collect_parsed(*processed_html.pop(0))
+        except BloggerFetchError as e:
+            # Fetch yang gagal di tengah jalan tidak boleh menghasilkan situs yang terpotong
+            print(f"Build dibatalkan supaya situs tidak terpotong, tidak ada file yang ditulis. Fetch gagal: {e}")
+            renderer.close()
+            if spool is not None:
+                spool.close()
+            return False
+        profiler.end(items=len(processed_posts))
+
+        if processed_posts:
             print(f"Output directory created/ensured: {output_dir}")
 
             pages_output_dir = os.path.join(output_dir, 'pages')
@@ -203,123 +290,134 @@ def main():
             os.makedirs(categories_output_dir, exist_ok=True)
             print(f"Categories directory created/ensured: {categories_output_dir}")
 
-            template_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
-            if not os.path.isdir(template_dir):
-                raise FileNotFoundError(f"Template directory not found: {template_dir}")
-            
-            template_loader = FileSystemLoader(template_dir)
-            env = Environment(loader=template_loader)
-            
-            env.filters['slugify'] = slugify
-            
-            # Filter baru untuk mengonversi tanggal, asumsikan 'published' format ISO 8601
-            # Contoh: "2023-10-27T10:00:00Z"
-            env.filters['date_format'] = lambda value, fmt="%d %b %Y": datetime.fromisoformat(value.replace('Z', '+00:00')).strftime(fmt)
-            
-            list_posts_template = env.get_template('index_template.html')  
-            single_post_template = env.get_template('single_post_template.html')
-            category_detail_template = env.get_template('category_detail_template.html')
-
-            # --- PRE-PROCESS SEMUA POSTINGAN UNTUK MEMBANGUN DATA YANG DIBUTUHKAN ---
-            fully_processed_posts = []
-            all_labels = set()  
-            posts_by_label = {}  
-
-            for post_item in all_posts_raw:
-                post = post_item.copy()  
-
-                post_slug = slugify(post.get('title', 'untitled-post'))
-                # Gunakan 'id' atau 'url' dari Blogger jika ada untuk detail_url yang lebih stabil
-                # Atau tetap pakai slug jika Anda ingin URL statis
-                # post['detail_url'] = post.get('url') # Jika ingin pakai URL asli Blogger
-                post['detail_url'] = f"/{post_slug}.html" # Jika ingin pakai slug sebagai URL file lokal
-                
-                raw_html_content = post.get('content', '')
-                post['thumbnail_url'] = get_first_image_url(raw_html_content, size='s320')
-                post['parsed_content'] = parse_html_content_preview(raw_html_content, num_words=13)  
-                post['optimized_content'] = optimize_blogger_images_in_content(raw_html_content, default_size='s800')  
-                
-                # Pastikan tanggal 'published' ada dan valid untuk sorting
-                if 'published' in post:
-                    fully_processed_posts.append(post)
-
-                labels = post.get('labels', [])
-                if labels:
-                    for label in labels:
-                        all_labels.add(label)
-                        label_slug = slugify(label)
-                        if label_slug not in posts_by_label:
-                            posts_by_label[label_slug] = {
-                                'name': label,
-                                'slug': label_slug,
-                                'posts': []
-                            }
-                        posts_by_label[label_slug]['posts'].append(post)
-
-            # --- BARIS BARU UNTUK MENGURUTKAN DAN MENGAMBIL POSTINGAN TERBARU ---
-            # Urutkan semua postingan berdasarkan tanggal publikasi (terbaru dulu)
-            # Pastikan 'published' ada di setiap post sebelum sorting
-            fully_processed_posts.sort(key=lambda p: datetime.fromisoformat(p['published'].replace('Z', '+00:00')), reverse=True)
-            
-            # Ambil 5 postingan terbaru (Anda bisa ubah angka ini)
-            num_recent_posts_widget = 5
-            recent_posts_for_widget = fully_processed_posts[:num_recent_posts_widget]
+            # Tunggu parsing HTML yang masih berjalan di worker
+            profiler.start('preprocess_html')
+            while processed_html:
+                parsed_count += collect_parsed(*processed_html.pop(0))
+            profiler.end(items=parsed_count)
+
+            # --- MODEL SITUS: URUTAN, PARTISI LABEL, DAN PAGINASI DIHITUNG SEKALI ---
+            # Hanya postingan dengan tanggal 'published' yang ikut (dibutuhkan untuk sorting)
+            profiler.start('site_model')
+            site = SiteModel(processed_posts, posts_per_page=5, posts_per_category_page=5, num_recent_posts=5)
+            fully_processed_posts = site.posts
+            recent_posts_for_widget = site.recent_posts
             print(f"Collected {len(recent_posts_for_widget)} recent posts for the widget.")
-            # --- AKHIR BARIS BARU ---
 
+            # Konteks ringkas yang sama untuk semua halaman (juga dikirim ke worker)
+            sorted_labels = site.labels
+            current_year = datetime.now().year
+            recent_posts_context = [compact_post(p, RECENT_FIELDS) for p in recent_posts_for_widget]
+            service_worker_url = f"/{SERVICE_WORKER_FILENAME}" if args.service_worker else None
+
+            # Header, footer, dan sidebar sama untuk semua halaman: render sekali, sisipkan di setiap halaman
+            renderer.prerender_fragments({
+                'all_labels': sorted_labels,
+                'current_year': current_year,
+                'recent_posts': recent_posts_context,
+                'service_worker_url': service_worker_url
+            })
 
-            # --- GENERASI HALAMAN INDIVIDUAL POSTINGAN & MENCARI RELATED POSTS ---
+            # Dependensi yang dipakai bersama oleh semua halaman satu jenis: sidebar label, widget recent posts,
+            # serta template halaman itu beserta template yang di-extends/include-nya (dan CSS kritisnya).
+            # Perubahan single_post_template.html hanya membuat halaman postingan kotor; custom_sidebar.html semuanya.
+            shared_fingerprints = dict.fromkeys(PAGE_TEMPLATES)
+            if manifest is not None:
+                template_graph = TemplateGraph(template_dir)
+                shared_fingerprint = fingerprint(
+                    sorted_labels,
+                    # Widget hanya menampilkan judul dan URL: edit isi postingan terbaru tidak membuat semua halaman kotor
+                    recent_posts_context,
+                    current_year,
+                    service_worker_url
+                )
+                shared_fingerprints = {
+                    name: fingerprint(shared_fingerprint, template_graph.digest(name), assets.digest(name))
+                    for name in PAGE_TEMPLATES
+                }
+            profiler.end(items=len(fully_processed_posts))
+
+            # --- MENCARI RELATED POSTS ---
+            # Inverted index label -> postingan, diurutkan berdasarkan kemiripan label (terbaru jika sama)
+            profiler.start('related_posts')
+            related_posts_by_id = compute_related_posts(fully_processed_posts, top_k=5)
+            profiler.end(items=len(fully_processed_posts))
+
+            # --- GENERASI HALAMAN INDIVIDUAL POSTINGAN ---
+            profiler.start('render_posts')
+            rendered_before = renderer.rendered
             for post in fully_processed_posts:  # Gunakan fully_processed_posts yang sudah diurutkan
-                post_slug = slugify(post.get('title', 'untitled-post'))
-                post_filename = f"{post_slug}.html"
+                post_filename = post['detail_url'].lstrip('/')
 
-                related_posts = []
-                current_post_labels = set(post.get('labels', []))
-                
-                if current_post_labels:  
-                    for other_post in fully_processed_posts:
-                        if other_post['id'] != post['id'] and \
-                           len(set(other_post.get('labels', [])) & current_post_labels) > 0:
-                            related_posts.append(other_post)
-                            
-                        if len(related_posts) >= 5:  
-                            break
-                    
-                post['related_posts'] = related_posts
+                related_posts = related_posts_by_id[post['id']]
+                related_context = [compact_post(p, RELATED_FIELDS) for p in related_posts]
 
-                single_post_html = single_post_template.render(
-                    post=post,
-                    all_labels=sorted(list(all_labels)),  
-                    current_year=datetime.now().year,
-                    # --- TERUSKAN RECENT_POSTS KE SINGLE_POST_TEMPLATE JUGA ---
-                    recent_posts=recent_posts_for_widget  
-                )
-                
                 single_post_file_path = os.path.join(output_dir, post_filename)
-                with open(single_post_file_path, "w", encoding="utf-8") as f:
-                    f.write(single_post_html)
-                print(f"Generated: {single_post_file_path}")
+                if manifest is not None:
+                    manifest.record_post(post, post_digests[post['id']], post_filename)
+                    page_fingerprint = fingerprint(
+                        shared_fingerprints['single_post_template.html'],
+                        post_digests[post['id']],
+                        # Hanya field related posts yang ditampilkan (judul, URL, thumbnail), bukan isinya
+                        related_context
+                    )
+                    if is_fresh(single_post_file_path, page_fingerprint):
+                        post.pop_content()  # Tidak di-render: HTML-nya tidak dibutuhkan lagi
+                        continue
+                    record_page(single_post_file_path, page_fingerprint)
+
+                # HTML penuh hanya dipegang selama halaman ini di-render
+                optimized_content, optimized = post.pop_content(spool)
+                if not optimized:
+                    optimized_content = optimize_blogger_images_in_content(optimized_content or '', default_size='s800')
+
+                post_context = compact_post(post, LISTING_FIELDS)
+                post_context['optimized_content'] = optimized_content
+                post_context['related_posts'] = related_context
+
+                renderer.render('single_post_template.html', single_post_file_path, {
+                    'post': post_context,
+                    'all_labels': sorted_labels,
+                    'current_year': current_year,
+                    # --- TERUSKAN RECENT_POSTS KE SINGLE_POST_TEMPLATE JUGA ---
+                    'recent_posts': recent_posts_context
+                }, f"Generated: {single_post_file_path}")
+            renderer.flush()
+            if spool is not None:
+                spool.close()
+            profiler.end(items=renderer.rendered - rendered_before)
             
             # --- PAGINASI UNTUK HALAMAN UTAMA (index.html dan pages/*.html) ---
-            posts_per_page = 5 # Jumlah postingan per halaman INDEX utama
+            profiler.start('render_index')
+            rendered_before = renderer.rendered
+            posts_per_page = site.posts_per_page # Jumlah postingan per halaman INDEX utama
             total_posts = len(fully_processed_posts)
-            total_pages = math.ceil(total_posts / posts_per_page)
+            total_pages = len(site.index_pages)
 
             print(f"Total posts: {total_posts}, Posts per page (Index): {posts_per_page}, Total pages (Index): {total_pages}")
 
-            for page_num in range(1, total_pages + 1):
-                start_index = (page_num - 1) * posts_per_page
-                end_index = start_index + posts_per_page
-                current_page_posts = fully_processed_posts[start_index:end_index]
+            for page_num, current_page_posts in enumerate(site.index_pages, start=1):
+                if page_num == 1:
+                    index_file_path = os.path.join(output_dir, 'index.html')
+                else:
+                    index_file_path = os.path.join(pages_output_dir, f"{page_num}.html")
+                if manifest is not None:
+                    page_fingerprint = fingerprint(
+                        shared_fingerprints['index_template.html'], 'index', page_num, total_pages,
+                        [post_digests[p['id']] for p in current_page_posts]
+                    )
+                    if is_fresh(index_file_path, page_fingerprint):
+                        continue
+                    record_page(index_file_path, page_fingerprint)
 
                 page_context = {
-                    'posts': current_page_posts,
+                    'posts': [compact_post(p) for p in current_page_posts],
                     'current_page': page_num,
                     'total_pages': total_pages,
-                    'all_labels': sorted(list(all_labels)),  
-                    'current_year': datetime.now().year,
+                    'all_labels': sorted_labels,
+                    'current_year': current_year,
                     # --- TERUSKAN RECENT_POSTS KE INDEX_TEMPLATE (dan pages/*.html) ---
-                    'recent_posts': recent_posts_for_widget  
+                    'recent_posts': recent_posts_context
                 }
 
                 if page_num > 1:
@@ -332,52 +430,70 @@ def main():
                 else:
                     page_context['next_page_url'] = None
                 
-                rendered_page_html = list_posts_template.render(page_context)
-                
-                if page_num == 1:
-                    index_file_path = os.path.join(output_dir, 'index.html')
-                    with open(index_file_path, "w", encoding="utf-8") as f:
-                        f.write(rendered_page_html)
-                    print(f"Generated: {index_file_path} (Page 1)")
-                else:
-                    page_filename = f"{page_num}.html"
-                    page_file_path = os.path.join(pages_output_dir, page_filename)
-                    with open(page_file_path, "w", encoding="utf-8") as f:
-                        f.write(rendered_page_html)
-                    print(f"Generated: {page_file_path} (Page {page_num})")
+                renderer.render('index_template.html', index_file_path, page_context,
+                                f"Generated: {index_file_path} (Page {page_num})")
+
+            # Halaman hasil pencarian (tujuan form pencarian di header); hasilnya diisi oleh script/search.js
+            search_page_path = os.path.join(output_dir, 'search.html')
+            search_page_fingerprint = fingerprint(shared_fingerprints['search_template.html'], 'search')
+            if not is_fresh(search_page_path, search_page_fingerprint):
+                record_page(search_page_path, search_page_fingerprint)
+                renderer.render('search_template.html', search_page_path, {
+                    'all_labels': sorted_labels,
+                    'current_year': current_year,
+                    'recent_posts': recent_posts_context
+                }, f"Generated: {search_page_path}")
+            renderer.flush()
+            profiler.end(items=renderer.rendered - rendered_before)
             
             # --- GENERASI HALAMAN DETAIL KATEGORI (DENGAN PAGINASI UNTUK TIAP KATEGORI) ---
-            posts_per_category_page = 5 # Jumlah postingan per halaman KATEGORI
+            profiler.start('render_categories')
+            rendered_before = renderer.rendered
+            # Postingan per kategori sudah terurut (terbaru dulu) dan dipaginasi di site model
+            for label_slug, label_info in site.posts_by_label.items():
+                total_category_posts = len(label_info['posts'])
+                total_category_pages = len(label_info['pages'])
 
-            for label_slug, label_info in posts_by_label.items():
-                # Pastikan postingan di kategori juga diurutkan berdasarkan tanggal terbaru
-                category_posts = sorted(label_info['posts'], key=lambda p: datetime.fromisoformat(p['published'].replace('Z', '+00:00')), reverse=True)
-                total_category_posts = len(category_posts)
-                total_category_pages = math.ceil(total_category_posts / posts_per_category_page)
-
-                print(f"Generating pages for category '{label_info['name']}': Total posts {total_category_posts}, Total pages {total_category_pages}")
+                if not args.quiet:
+                    print(f"Generating pages for category '{label_info['name']}': Total posts {total_category_posts}, Total pages {total_category_pages}")
 
                 # Buat folder untuk sub-paginasi kategori jika diperlukan (misal: kategori/nama-slug/page/)
                 category_slug_dir = os.path.join(categories_output_dir, label_slug)
                 os.makedirs(category_slug_dir, exist_ok=True)
 
 
-                for page_num in range(1, total_category_pages + 1):
-                    start_index = (page_num - 1) * posts_per_category_page
-                    end_index = start_index + posts_per_category_page
-                    current_category_page_posts = category_posts[start_index:end_index]
+                for page_num, current_category_page_posts in enumerate(label_info['pages'], start=1):
+                    # Tentukan path file output
+                    if page_num == 1:
+                        # Halaman pertama kategori akan disimpan di kategori/nama-slug.html
+                        category_file_path = os.path.join(categories_output_dir, f"{label_slug}.html")
+                    else:
+                        # Halaman paginasi kategori akan disimpan di kategori/nama-slug/page/X.html
+                        # Pastikan folder 'page' dibuat jika belum ada
+                        category_page_dir = os.path.join(category_slug_dir, 'page')
+                        os.makedirs(category_page_dir, exist_ok=True)
+                        category_file_path = os.path.join(category_page_dir, f"{page_num}.html")
+
+                    if manifest is not None:
+                        page_fingerprint = fingerprint(
+                            shared_fingerprints['category_detail_template.html'], 'kategori', label_info['name'], page_num, total_category_pages,
+                            [post_digests[p['id']] for p in current_category_page_posts]
+                        )
+                        if is_fresh(category_file_path, page_fingerprint):
+                            continue
+                        record_page(category_file_path, page_fingerprint)
 
                     # Konteks untuk template kategori
                     category_detail_context = {
                         'label_name': label_info['name'],
                         'label_slug': label_slug, # Tambahkan label_slug ke konteks agar bisa dipakai di template
-                        'posts': current_category_page_posts,
+                        'posts': [compact_post(p) for p in current_category_page_posts],
                         'current_page': page_num,
                         'total_pages': total_category_pages,
-                        'all_labels': sorted(list(all_labels)),
-                        'current_year': datetime.now().year,
+                        'all_labels': sorted_labels,
+                        'current_year': current_year,
                         # --- TERUSKAN RECENT_POSTS KE CATEGORY_DETAIL_TEMPLATE JUGA ---
-                        'recent_posts': recent_posts_for_widget  
+                        'recent_posts': recent_posts_context
                     }
 
                     # Atur URL paginasi untuk kategori
@@ -395,22 +511,10 @@ def main():
                         category_detail_context['next_page_url'] = None
                     
                     # Render HTML kategori
-                    category_detail_html = category_detail_template.render(category_detail_context)
-                    
-                    # Tentukan path file output
-                    if page_num == 1:
-                        # Halaman pertama kategori akan disimpan di kategori/nama-slug.html
-                        category_file_path = os.path.join(categories_output_dir, f"{label_slug}.html")
-                    else:
-                        # Halaman paginasi kategori akan disimpan di kategori/nama-slug/page/X.html
-                        # Pastikan folder 'page' dibuat jika belum ada
-                        category_page_dir = os.path.join(category_slug_dir, 'page')
-                        os.makedirs(category_page_dir, exist_ok=True)
-                        category_file_path = os.path.join(category_page_dir, f"{page_num}.html")
-                    
-                    with open(category_file_path, "w", encoding="utf-8") as f:
-                        f.write(category_detail_html)
-                    print(f"Generated: {category_file_path} (Category '{label_info['name']}' Page {page_num})")
+                    renderer.render('category_detail_template.html', category_file_path, category_detail_context,
+                                    f"Generated: {category_file_path} (Category '{label_info['name']}' Page {page_num})")
+            renderer.close()
+            profiler.end(items=renderer.rendered - rendered_before)
             
             # --- GENERATE SITEMAP ---
             # PENTING: GANTI INI DENGAN DOMAIN SITUS ANDA!
@@ -418,16 +522,62 @@ def main():
             # Jika menggunakan custom domain, gunakan custom domain Anda: "https://www.yourdomain.com"
             your_website_base_url = "https://tantemagz.github.io" # <--- GANTI INI!
             
-            generate_sitemap(
-                processed_posts=fully_processed_posts,
-                all_labels=all_labels,
-                total_main_pages=total_pages, # total_pages dari paginasi halaman utama
-                posts_per_main_page=posts_per_page, # posts_per_page dari paginasi halaman utama
-                posts_by_label=posts_by_label,
-                base_url=your_website_base_url
+            profiler.start('sitemap')
+            sitemap_urls = generate_sitemap(site, base_url=your_website_base_url, output_dir=output_dir,
+                                            gzip_output=args.sitemap_gzip, output=output)
+            profiler.end(items=sitemap_urls)
+
+            # --- INDEKS PENCARIAN STATIS (dari judul, label, dan teks preview hasil preprocessing) ---
+            profiler.start('search_index')
+            search_index_path = os.path.join(output_dir, SEARCH_DIR, SEARCH_INDEX_FILENAME)
+            search_fingerprint = fingerprint(
+                'search', SEARCH_INDEX_VERSION, assets.digest(), [post_digests[p['id']] for p in fully_processed_posts]
             )
+            if manifest is not None and manifest.is_fresh(
+                    os.path.relpath(search_index_path, output_dir), search_fingerprint,
+                    exists=os.path.exists(search_index_path)) and keep_search_index(output_dir, output):
+                search_shards = None
+            else:
+                search_shards = build_search_index(fully_processed_posts, output_dir,
+                                                   published_date=site.published_date, output=output)
+                record_page(search_index_path, search_fingerprint)
+            profiler.end(items=search_shards)
+
+            # --- SERVICE WORKER: revisi precache dihitung dari file yang baru saja ditulis ---
+            if args.service_worker:
+                profiler.start('service_worker')
+                precache_count = build_service_worker(output_dir, recent_posts_for_widget, output)
+                profiler.end(items=precache_count)
+
+            profiler.start('finalize')
+
+            if manifest is not None:
+                removed_post_paths = manifest.prune_posts({p['id'] for p in fully_processed_posts})
+                for removed_path in removed_post_paths:
+                    output.remove(os.path.join(output_dir, removed_path))
+                manifest.save()
+                print(f"Incremental build: {manifest.rendered} halaman di-render, {manifest.skipped} halaman tidak berubah.")
+
+            # Aset statis dari repo (bukan hasil build) hanya mendapat sibling prakompresi
+            for static_asset in [os.path.join(output_dir, 'style.css')] + glob.glob(os.path.join(output_dir, 'script', '*.js')):
+                output.precompress_source(static_asset)
+
+            # Hapus file yang dihasilkan build sebelumnya tapi tidak lagi dihasilkan, lalu tulis laporan perubahan
+            output.prune()
+            output.save(args.change_report)
+            profiler.end()
+
+            profiler.save(args.build_report, bytes_written=output.bytes_written, extra={
+                'jobs': renderer.jobs,
+                'incremental': manifest is not None,
+                'posts': len(fully_processed_posts),
+            })
+            return True
 
         else:
+            renderer.close()
+            if spool is not None:
+                spool.close()
             print("No posts found or an error occurred. No HTML files generated.")
 
     except FileNotFoundError as e:
@@ -436,6 +586,7 @@ def main():
         print(f"Configuration error: {e}")
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
+    return False
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,186 @@
+# output_writer.py
+# Lapisan output untuk semua file yang dihasilkan build:
+#   - write-if-changed: file yang isinya sama persis tidak ditulis ulang,
+#   - penulisan atomik lewat file sementara + rename,
+#   - pruning file yang tidak lagi dihasilkan build ini,
+#   - laporan perubahan (added/changed/removed) yang bisa dibaca mesin.
+import os
+import json
+import hashlib
+
+DEFAULT_STATE_PATH = os.path.join('.build-cache', 'outputs.json')
+DEFAULT_REPORT_PATH = os.path.join('.build-cache', 'changes.json')
+
+ADDED = 'added'
+CHANGED = 'changed'
+UNCHANGED = 'unchanged'
+
+
+def _file_hash(path):
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _same_content(path, data):
+    """
+    True jika file di path sudah berisi data yang sama persis.
+    Ukuran file dibandingkan dulu supaya file yang jelas berbeda tidak perlu dibaca.
+    """
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+    except OSError:
+        return False
+    return _file_hash(path) == hashlib.sha1(data).hexdigest()
+
+
+def write_if_changed(path, data):
+    """
+    Menulis data (str atau bytes) ke path secara atomik, hanya jika isinya berubah.
+    Bisa dipanggil dari proses worker. Mengembalikan 'added', 'changed', atau 'unchanged'.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    existed = os.path.exists(path)
+    if existed and _same_content(path, data):
+        return UNCHANGED
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return CHANGED if existed else ADDED
+
+
+def commit_temp_file(tmp_path, path):
+    """
+    Memindahkan file sementara yang sudah selesai ditulis (misal shard sitemap yang di-stream)
+    ke path tujuan, kecuali isinya sama dengan file yang sudah ada.
+    """
+    existed = os.path.exists(path)
+    if existed and os.path.getsize(tmp_path) == os.path.getsize(path) and _file_hash(tmp_path) == _file_hash(path):
+        os.remove(tmp_path)
+        return UNCHANGED
+    os.replace(tmp_path, path)
+    return CHANGED if existed else ADDED
+
+
+class OutputWriter:
+    """
+    Mencatat semua file yang dihasilkan build ini (relatif terhadap output_dir) beserta statusnya.
+    Daftar output build sebelumnya disimpan di state_path, sehingga prune() hanya pernah menghapus
+    file yang memang dulu dihasilkan build (bukan file sumber di repo).
+    """
+
+    def __init__(self, output_dir, state_path=DEFAULT_STATE_PATH, assets=None):
+        self.output_dir = output_dir
+        self.state_path = state_path
+        self.assets = assets  # AssetPipeline opsional: sibling .gz/.br ikut ditulis dan dicatat
+        self.statuses = {}
+        self.removed = []
+        self.bytes_written = 0
+        self.previous_outputs = set()
+        if os.path.exists(state_path):
+            try:
+                with open(state_path, 'r', encoding='utf-8') as f:
+                    self.previous_outputs = set(json.load(f).get('outputs', []))
+            except (OSError, ValueError) as e:
+                print(f"Daftar output build sebelumnya tidak bisa dibaca ({e}), pruning dilewati.")
+
+    def _key(self, path):
+        return os.path.relpath(path, self.output_dir).replace(os.sep, '/')
+
+    def record(self, path, status):
+        self.statuses[self._key(path)] = status
+        if status != UNCHANGED:
+            self.bytes_written += os.path.getsize(path)
+
+    def record_all(self, results):
+        for path, status in results:
+            self.record(path, status)
+
+    def write(self, path, data):
+        if self.assets is not None:
+            results = self.assets.write(path, data)
+            self.record_all(results)
+            return results[0][1]
+        status = write_if_changed(path, data)
+        self.record(path, status)
+        return status
+
+    def commit(self, tmp_path, path):
+        status = commit_temp_file(tmp_path, path)
+        self.record(path, status)
+        if self.assets is not None and self.assets.siblings(path):
+            with open(path, 'rb') as f:
+                self.record_all(self.assets.compress(path, f.read(), status))
+        return status
+
+    def keep(self, path):
+        """
+        Menandai file yang sengaja tidak ditulis ulang (misal dilewati build incremental) tetap sebagai output.
+        """
+        self.record(path, UNCHANGED)
+        if self.assets is not None:
+            for sibling in self.assets.siblings(path):
+                if os.path.exists(sibling):
+                    self.record(sibling, UNCHANGED)
+
+    def precompress_source(self, path):
+        """
+        Menulis sibling .gz/.br untuk file sumber statis (misal style.css). Hanya siblingnya yang
+        dicatat sebagai output; file sumber sendiri tidak boleh pernah ikut di-prune.
+        """
+        if self.assets is None or not self.assets.siblings(path) or not os.path.exists(path):
+            return
+        with open(path, 'rb') as f:
+            data = f.read()
+        siblings = self.assets.siblings(path)
+        fresh = all(os.path.exists(s) and os.path.getmtime(s) >= os.path.getmtime(path) for s in siblings)
+        self.record_all(self.assets.compress(path, data, UNCHANGED if fresh else CHANGED))
+
+    def remove(self, path):
+        key = self._key(path)
+        if key in self.statuses:
+            return
+        if os.path.exists(path):
+            os.remove(path)
+            self.removed.append(key)
+            print(f"Removed: {path}")
+            # Hapus juga folder yang jadi kosong (misal kategori/nama-slug/page/), tapi tidak output_dir
+            parent = os.path.dirname(os.path.abspath(path))
+            root = os.path.abspath(self.output_dir)
+            while parent != root and parent.startswith(root) and not os.listdir(parent):
+                os.rmdir(parent)
+                parent = os.path.dirname(parent)
+
+    def prune(self):
+        """
+        Menghapus file yang dihasilkan build sebelumnya tetapi tidak dihasilkan build ini.
+        """
+        for key in sorted(self.previous_outputs - set(self.statuses)):
+            self.remove(os.path.join(self.output_dir, key))
+
+    def report(self):
+        return {
+            'added': sorted(k for k, s in self.statuses.items() if s == ADDED),
+            'changed': sorted(k for k, s in self.statuses.items() if s == CHANGED),
+            'removed': sorted(self.removed),
+            'unchanged': sum(1 for s in self.statuses.values() if s == UNCHANGED),
+            'bytes_written': self.bytes_written,
+        }
+
+    def save(self, report_path=DEFAULT_REPORT_PATH):
+        """
+        Menyimpan daftar output untuk build berikutnya dan menulis laporan perubahan ke report_path.
+        """
+        report = self.report()
+        for path, payload in ((self.state_path, {'outputs': sorted(self.statuses)}), (report_path, report)):
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2)
+        print(f"Output: {len(report['added'])} ditambahkan, {len(report['changed'])} berubah, "
+              f"{len(report['removed'])} dihapus, {report['unchanged']} tidak berubah. Laporan: {report_path}")
+        return report
@@ -0,0 +1,118 @@
+# post_record.py
+# Representasi postingan yang ringkas untuk blog besar:
+#   - PostRecord memakai __slots__ dan hanya menyimpan field yang dipakai template, sitemap,
+#     indeks pencarian, dan manifest (bukan salinan dict mentah dari Blogger API),
+#   - label disimpan sebagai tuple yang di-intern, jadi postingan dengan label yang sama berbagi satu objek,
+#   - HTML penuh postingan disimpan terpisah dan diambil (lalu dilepas) tepat saat halamannya di-render.
+#     Dengan ContentSpool HTML itu ditulis ke file sementara di disk, sehingga memori build
+#     hampir tidak bertambah seiring jumlah postingan.
+import os
+import sys
+import tempfile
+
+DEFAULT_SPOOL_DIR = '.build-cache'
+
+_label_tuples = {}  # tuple label -> tuple yang sama (di-intern), dipakai bersama oleh semua postingan
+
+
+def intern_labels(labels):
+    labels = tuple(sys.intern(label) for label in labels)
+    return _label_tuples.setdefault(labels, labels)
+
+
+class PostRecord:
+    """
+    Postingan hasil preprocessing. Bisa dibaca seperti dict (post['id'], post.get('labels', []),
+    'thumbnail_url' in post), jadi site model, related posts, sitemap, dan compact_post tidak perlu
+    tahu bedanya. Field yang tidak ada di data Blogger juga tidak ada di record.
+    """
+
+    FIELDS = ('id', 'title', 'detail_url', 'thumbnail_url', 'parsed_content', 'labels', 'published', 'updated')
+    __slots__ = FIELDS + ('_content', '_content_optimized')
+
+    def __init__(self, **fields):
+        for name, value in fields.items():
+            setattr(self, name, value)
+        self._content = None
+        self._content_optimized = False
+
+    @classmethod
+    def from_post(cls, post, detail_url):
+        """
+        Record dari satu postingan mentah Blogger API, tanpa konten HTML-nya.
+        """
+        record = cls(detail_url=detail_url)
+        for name in ('id', 'title', 'published', 'updated'):
+            if name in post:
+                setattr(record, name, post[name])
+        if 'labels' in post:
+            record.labels = intern_labels(post['labels'])
+        return record
+
+    def __getitem__(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.FIELDS and hasattr(self, key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def store_content(self, html, optimized, spool=None):
+        """
+        Menyimpan HTML postingan sampai halamannya di-render. optimized=False berarti HTML mentah
+        dari Blogger yang gambarnya belum dioptimasi (postingan yang hasil parsing-nya diambil dari manifest).
+        """
+        self._content = spool.put(html) if spool is not None else html
+        self._content_optimized = optimized
+
+    def pop_content(self, spool=None):
+        """
+        Mengambil HTML yang disimpan store_content lalu melepasnya dari record.
+        Mengembalikan (html, optimized); html None jika tidak ada yang disimpan.
+        """
+        content, self._content = self._content, None
+        if content is not None and spool is not None:
+            content = spool.get(content)
+        return content, self._content_optimized
+
+
+class ContentSpool:
+    """
+    File sementara (otomatis dihapus saat ditutup) tempat HTML postingan disimpan selama build.
+    put() mengembalikan referensi (offset, panjang) yang cukup kecil untuk disimpan di record.
+    """
+
+    def __init__(self, directory=DEFAULT_SPOOL_DIR):
+        os.makedirs(directory, exist_ok=True)
+        self._file = tempfile.TemporaryFile(dir=directory, prefix='content-spool-')
+        self._size = 0
+
+    def put(self, html):
+        data = (html or '').encode('utf-8')
+        self._file.seek(self._size)
+        self._file.write(data)
+        ref = (self._size, len(data))
+        self._size += len(data)
+        return ref
+
+    def get(self, ref):
+        offset, length = ref
+        self._file.seek(offset)
+        return self._file.read(length).decode('utf-8')
+
+    def close(self):
+        self._file.close()
@@ -0,0 +1,147 @@
+# post_store.py
+# Penyimpanan lokal postingan Blogger (JSON-lines, satu postingan per baris)
+# supaya build berikutnya cukup mengambil postingan yang berubah sejak sinkronisasi terakhir.
+import os
+import json
+from datetime import datetime, timezone, timedelta
+from blogger_fetcher import iter_pages
+
+DEFAULT_STORE_PATH = os.path.join('.build-cache', 'posts.jsonl')
+DEFAULT_FULL_SYNC_DAYS = 7
+# Delta fetch mulai dari halaman kecil (setiap postingan membawa kontennya), lalu membesar
+# hanya jika satu halaman penuh masih lebih baru dari isi store
+DELTA_FIRST_PAGE_SIZE = 25
+
+
+def _parse_time(value):
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+class PostStore:
+    """
+    Store postingan yang dikunci dengan id Blogger.
+
+    Baris pertama file adalah metadata ({"_meta": {...}}), sisanya satu postingan per baris.
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        self.path = path
+        self.posts = {}
+        self.meta = {}
+
+    @classmethod
+    def load(cls, path=DEFAULT_STORE_PATH):
+        store = cls(path)
+        if not os.path.exists(path):
+            return store
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    if '_meta' in record:
+                        store.meta = record['_meta']
+                    else:
+                        store.posts[record['id']] = record
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Post store tidak bisa dibaca ({e}), melakukan sinkronisasi penuh.")
+            return cls(path)
+        return store
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'_meta': self.meta}, ensure_ascii=False) + "\n")
+            for post in self.posts.values():
+                f.write(json.dumps(post, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.path)
+
+    def latest_updated(self):
+        """
+        Timestamp 'updated' terbaru di store (dipakai sebagai batas delta fetch), atau None.
+        """
+        latest = None
+        for post in self.posts.values():
+            if post.get('updated'):
+                updated = _parse_time(post['updated'])
+                if latest is None or updated > latest:
+                    latest = updated
+        return latest
+
+    def needs_full_sync(self, full_sync_days=DEFAULT_FULL_SYNC_DAYS):
+        if not self.posts or not self.meta.get('last_full_sync') or self.latest_updated() is None:
+            return True
+        last_full_sync = _parse_time(self.meta['last_full_sync'])
+        return datetime.now(timezone.utc) - last_full_sync >= timedelta(days=full_sync_days)
+
+    def merge(self, posts):
+        for post in posts:
+            self.posts[post['id']] = post
+
+    def all_posts(self):
+        """
+        Semua postingan, terbaru dulu (urutan yang sama dengan Blogger API).
+        """
+        return sorted(self.posts.values(), key=lambda p: p.get('published', ''), reverse=True)
+
+    def drain_pages(self, page_size=500):
+        """
+        Mengeluarkan postingan dari store per halaman (urutan sama dengan all_posts), seperti iter_pages.
+        Setiap postingan dilepas dari store begitu halamannya diambil, jadi data mentah tidak ikut
+        tertahan selama sisa build. Store kosong setelahnya; panggil save() sebelumnya, bukan sesudahnya.
+        """
+        ids = sorted(self.posts, key=lambda post_id: self.posts[post_id].get('published', ''), reverse=True)
+        for start in range(0, len(ids), page_size):
+            yield [self.posts.pop(post_id) for post_id in ids[start:start + page_size]]
+
+
+def sync_posts(store, blog_id, api_key, max_results=500, full=False, full_sync_days=DEFAULT_FULL_SYNC_DAYS,
+               fetch_page=None):
+    """
+    Menyinkronkan store dengan Blogger API lalu menyimpannya ke disk.
+
+    - Sinkronisasi penuh (store kosong, dipaksa, atau sudah lewat full_sync_days):
+      semua postingan diunduh dan store diganti, sehingga postingan yang dihapus ikut hilang.
+    - Delta: postingan diurutkan berdasarkan 'updated' dan pengambilan berhenti
+      begitu mencapai postingan yang tidak lebih baru dari isi store. Halaman pertama berisi
+      DELTA_FIRST_PAGE_SIZE postingan, jadi data yang diunduh sebanding dengan jumlah perubahan.
+
+    Melempar BloggerFetchError (RuntimeError) jika ada halaman yang gagal, supaya store tidak
+    pernah diisi dengan hasil fetch yang terpotong.
+    fetch_page menggantikan get_blogger_posts (signature sama), misal untuk feed sintetis.
+    """
+    now = datetime.now(timezone.utc).isoformat()
+
+    if full or store.needs_full_sync(full_sync_days):
+        print("Post store: sinkronisasi penuh...")
+        fetched = {}
+        for items in iter_pages(blog_id, api_key, max_results, fetch_page=fetch_page):
+            for post_item in items:
+                if 'content' in post_item:
+                    fetched[post_item['id']] = post_item
+        store.posts = fetched
+        store.meta['last_full_sync'] = now
+        print(f"Post store: {len(fetched)} postingan disimpan.")
+    else:
+        cutoff = store.latest_updated()
+        print(f"Post store: delta fetch untuk postingan yang diperbarui sejak {cutoff.isoformat()}...")
+        changed = []
+        # Tanpa prefetch: biasanya hanya halaman pertama yang dibutuhkan, jangan boroskan kuota API
+        for items in iter_pages(blog_id, api_key, max_results, order_by='updated', fetch_page=fetch_page,
+                                prefetch=0, first_page_size=DELTA_FIRST_PAGE_SIZE):
+            reached_cutoff = False
+            for post_item in items:
+                if post_item.get('updated') and _parse_time(post_item['updated']) < cutoff:
+                    reached_cutoff = True
+                    break
+                if 'content' in post_item:
+                    changed.append(post_item)
+            if reached_cutoff:
+                break
+        store.merge(changed)
+        print(f"Post store: {len(changed)} postingan baru/diperbarui digabungkan.")
+
+    store.meta['last_sync'] = now
+    store.save()
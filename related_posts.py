@@ -0,0 +1,57 @@
+# related_posts.py
+# Perhitungan related posts memakai inverted index label -> postingan.
+# Hanya postingan yang berbagi minimal satu label yang dikunjungi, lalu kandidat diurutkan
+# berdasarkan kemiripan label (Jaccard) dengan tanggal terbaru sebagai tie-breaker.
+import heapq
+from collections import Counter, defaultdict
+from itertools import chain
+
+
+def build_label_index(posts):
+    """
+    Membangun index label -> daftar posisi postingan (posisi mengikuti urutan `posts`).
+    """
+    label_index = defaultdict(list)
+    for position, post in enumerate(posts):
+        for label in set(post.get('labels', [])):
+            label_index[label].append(position)
+    return label_index
+
+
+def compute_related_posts(posts, top_k=5):
+    """
+    Menghitung top-K related posts untuk setiap postingan.
+
+    Args:
+        posts (list): Postingan yang sudah diurutkan dari yang terbaru; posisi di list dipakai
+                      sebagai tie-breaker (lebih baru lebih dulu).
+        top_k (int): Jumlah maksimum related posts per postingan.
+
+    Returns:
+        dict: post id -> list postingan terkait, paling relevan dulu.
+    """
+    label_sets = [set(post.get('labels', [])) for post in posts]
+    label_sizes = [len(labels) for labels in label_sets]
+    label_index = build_label_index(posts)
+    related = {}
+
+    for position, post in enumerate(posts):
+        current_labels = label_sets[position]
+        if not current_labels:
+            related[post['id']] = []
+            continue
+
+        # Hitung jumlah label yang sama untuk setiap kandidat lewat index
+        overlap = Counter(chain.from_iterable(label_index[label] for label in current_labels))
+        overlap.pop(position, None)
+
+        current_size = len(current_labels)
+        best = heapq.nsmallest(top_k, (
+            # (-Jaccard, posisi): paling mirip dulu, lalu yang lebih baru
+            (-shared / (current_size + label_sizes[candidate] - shared), candidate)
+            for candidate, shared in overlap.items()
+        ))
+        best = [candidate for _, candidate in best]
+        related[post['id']] = [posts[candidate] for candidate in best
+                               if posts[candidate]['id'] != post['id']]
+    return related
@@ -0,0 +1,211 @@
+# renderer.py
+# Tahap render-dan-tulis halaman. Dengan jobs > 1, preprocessing HTML dan render template
+# dibagi ke beberapa proses worker; hasilnya byte-identik dengan build serial.
+import os
+import multiprocessing
+from functools import lru_cache, partial
+from concurrent.futures import ProcessPoolExecutor
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, pass_context
+from markupsafe import Markup
+from utils import slugify
+from html_processor import process_post_html
+from site_model import parse_published
+from output_writer import write_if_changed
+
+# Field postingan yang dipakai template daftar (index, kategori) dan widget
+LISTING_FIELDS = ('id', 'title', 'detail_url', 'thumbnail_url', 'parsed_content', 'labels', 'published')
+RELATED_FIELDS = ('title', 'detail_url', 'thumbnail_url')
+RECENT_FIELDS = ('title', 'detail_url')
+
+# Fragmen yang isinya sama untuk semua halaman dalam satu build; di-render sekali lalu disisipkan
+FRAGMENT_TEMPLATES = ('custom_header.html', 'custom_header_post.html', 'custom_sidebar.html', 'custom_footer.html')
+# Template halaman; masing-masing mendapat CSS kritisnya sendiri jika --critical-css aktif
+PAGE_TEMPLATES = ('index_template.html', 'category_detail_template.html', 'single_post_template.html',
+                  'search_template.html')
+DEFAULT_BYTECODE_CACHE_DIR = os.path.join('.build-cache', 'jinja')
+# Mode stream: batas halaman yang menunggu di-render per worker (konteksnya bisa berisi HTML penuh postingan)
+STREAM_PENDING_PER_WORKER = 32
+
+_env = None  # Environment Jinja milik proses ini (proses utama atau worker)
+_assets = None  # AssetPipeline milik proses ini (minifikasi, CSS kritis, prakompresi), opsional
+
+
+@lru_cache(maxsize=None)
+def date_format(value, fmt="%d %b %Y"):
+    """
+    Filter untuk mengonversi tanggal, asumsikan 'published' format ISO 8601 (contoh: "2023-10-27T10:00:00Z").
+    Hasilnya di-cache: tanggal yang sama muncul di banyak halaman (index, kategori, postingan).
+    """
+    return parse_published(value).strftime(fmt)
+
+
+@pass_context
+def render_fragment(context, name):
+    """
+    Global Jinja `fragment(name)`: mengembalikan fragmen yang sudah di-render sebelumnya,
+    atau me-render template itu dengan konteks halaman (sama seperti {% include %}) jika belum ada di cache.
+    """
+    cached = context.environment.fragment_cache.get(name)
+    if cached is not None:
+        return cached
+    return Markup(context.environment.get_template(name).render(context.get_all()))
+
+
+def create_environment(template_dir, bytecode_cache_dir=None, fragments=None):
+    """
+    Membuat Environment Jinja. bytecode_cache_dir mengaktifkan cache bytecode template di disk,
+    sehingga kompilasi template dilewati pada build berikutnya.
+    """
+    bytecode_cache = None
+    if bytecode_cache_dir:
+        os.makedirs(bytecode_cache_dir, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+    env = Environment(loader=FileSystemLoader(template_dir), bytecode_cache=bytecode_cache)
+    env.filters['slugify'] = slugify
+    env.filters['date_format'] = date_format
+    env.globals['fragment'] = render_fragment
+    env.fragment_cache = {name: Markup(html) for name, html in (fragments or {}).items()}
+    return env
+
+
+def compact_post(post, fields=LISTING_FIELDS):
+    """
+    Salinan kecil (dan bisa di-pickle) dari sebuah postingan, hanya berisi field yang dipakai template.
+    Field yang tidak ada di postingan juga tidak ditambahkan, supaya perilaku template tetap sama.
+    """
+    return {k: post[k] for k in fields if k in post}
+
+
+def _pool_context():
+    """
+    Start method untuk worker. Bukan fork: saat pool dibuat bisa ada thread lain yang sedang jalan
+    (prefetch Blogger API, server dev), dan fork dari proses multi-thread bisa mewarisi lock yang
+    sedang dipegang lalu deadlock. forkserver mem-fork worker dari proses bersih yang sudah mengimpor
+    modul ini; di platform tanpa forkserver dipakai spawn.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context('spawn')
+
+
+def _init_worker(template_dir, bytecode_cache_dir, fragments, assets=None):
+    global _env, _assets
+    _env = create_environment(template_dir, bytecode_cache_dir, fragments)
+    _assets = assets
+
+
+def render_page(task):
+    """
+    Me-render satu halaman dan menulisnya ke disk (hanya jika isinya berubah).
+    task = (nama template, path output, konteks). Mengembalikan [(path, status tulis)]:
+    file halaman, diikuti sibling .gz/.br jika prakompresi aktif.
+    """
+    template_name, output_path, context = task
+    html = _env.get_template(template_name).render(context)
+    if _assets is None:
+        return [(output_path, write_if_changed(output_path, html))]
+    return _assets.write(output_path, _assets.transform_html(template_name, html))
+
+
+class PageRenderer:
+    """
+    Mengeksekusi preprocessing dan render halaman, serial (jobs=1) atau lewat process pool.
+
+    Pada mode paralel halaman dikumpulkan lalu dieksekusi saat flush(), dan log
+    "Generated: ..." tetap dicetak dengan urutan yang sama seperti build serial.
+    Dengan stream=True antrean itu di-flush setiap kali penuh, jadi konteks yang tertahan di memori terbatas.
+    """
+
+    def __init__(self, template_dir, jobs=1, output=None, bytecode_cache_dir=DEFAULT_BYTECODE_CACHE_DIR, quiet=False,
+                 assets=None, stream=False):
+        global _env, _assets
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.template_dir = template_dir
+        self.output = output  # OutputWriter opsional untuk mencatat status tiap file
+        self.bytecode_cache_dir = bytecode_cache_dir
+        self.fragments = {}
+        self.quiet = quiet  # True: tidak mencetak log "Generated: ..." per file
+        self.rendered = 0
+        self.assets = assets if assets is not None and assets.enabled else None
+        self.max_pending = self.jobs * STREAM_PENDING_PER_WORKER if stream else None
+        _env = create_environment(template_dir, bytecode_cache_dir)
+        _assets = self.assets
+        self._pending = []
+        self._executor = None
+        self._start_pool()
+
+    def _start_pool(self):
+        if self.jobs <= 1:
+            return
+        if self._executor is not None:
+            self._executor.shutdown()
+        self._executor = ProcessPoolExecutor(max_workers=self.jobs, mp_context=_pool_context(), initializer=_init_worker,
+                                             initargs=(self.template_dir, self.bytecode_cache_dir, self.fragments,
+                                                       self.assets))
+
+    def prerender_fragments(self, context):
+        """
+        Me-render header, footer, dan sidebar (widget recent posts + daftar label) sekali per build
+        dengan konteks bersama, lalu memasangnya di environment proses utama dan semua worker.
+        Dipanggil sebelum render halaman pertama.
+        """
+        self.flush()
+        self.fragments = {name: _env.get_template(name).render(context) for name in FRAGMENT_TEMPLATES}
+        _env.fragment_cache = {name: Markup(html) for name, html in self.fragments.items()}
+        # Worker dibuat ulang supaya fragmen dikirim sekali per worker, bukan sekali per halaman
+        self._start_pool()
+
+    def _chunksize(self, count):
+        return max(1, count // (self.jobs * 4))
+
+    def process_html(self, contents, **kwargs):
+        """
+        Menjalankan process_post_html untuk banyak konten sekaligus, urutan hasil sama dengan input.
+        """
+        return list(self.submit_html(contents, **kwargs))
+
+    def submit_html(self, contents, **kwargs):
+        """
+        Seperti process_html, tetapi dengan worker pekerjaan langsung dijadwalkan dan hasilnya
+        dikembalikan sebagai iterator, jadi proses utama bisa lanjut (misal mengunduh halaman berikutnya).
+        """
+        worker = partial(process_post_html, **kwargs)
+        if self._executor is None:
+            return [worker(c) for c in contents]
+        return self._executor.map(worker, contents, chunksize=self._chunksize(len(contents)))
+
+    def render(self, template_name, output_path, context, log_message):
+        task = (template_name, output_path, context)
+        self.rendered += 1
+        if self._executor is None:
+            self._record(render_page(task))
+            self._log(log_message)
+        else:
+            self._pending.append((task, log_message))
+            if self.max_pending is not None and len(self._pending) >= self.max_pending:
+                self.flush()
+
+    def _log(self, message):
+        if not self.quiet:
+            print(message)
+
+    def _record(self, results):
+        if self.output is not None:
+            self.output.record_all(results)
+
+    def flush(self):
+        if not self._pending:
+            return
+        tasks = [task for task, _ in self._pending]
+        messages = [message for _, message in self._pending]
+        self._pending = []
+        for result, message in zip(self._executor.map(render_page, tasks, chunksize=self._chunksize(len(tasks))), messages):
+            self._record(result)
+            self._log(message)
+
+    def close(self):
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown()
@@ -0,0 +1,133 @@
+// Pencarian statis: membaca indeks yang dibuat search_index.py saat build.
+// Hanya shard term dengan prefix kata yang dicari dan bucket postingan yang muncul di hasil yang diunduh.
+(function () {
+    var BASE = "/search/";
+    var MAX_RESULTS = 20;
+    var container = document.getElementById("search-results");
+    var status = document.getElementById("search-status");
+    if (!container) return;
+
+    var cache = {};
+    function getJSON(name) {
+        if (!cache[name]) {
+            cache[name] = fetch(BASE + name).then(function (r) {
+                if (!r.ok) throw new Error(r.status);
+                return r.json();
+            });
+        }
+        return cache[name];
+    }
+
+    // Harus sama dengan normalize()/tokenize() di search_index.py
+    function tokenize(text) {
+        var normalized = text.normalize("NFKD").replace(/\p{M}/gu, "").toLowerCase();
+        return (normalized.match(/[\p{L}\p{N}]+/gu) || []).filter(function (t) { return t.length >= 2; });
+    }
+
+    function docBucket(key, buckets) {
+        return parseInt(key.slice(-2), 36) % buckets;
+    }
+
+    function setStatus(text) {
+        if (status) status.textContent = text;
+    }
+
+    function renderResults(results, docs) {
+        container.textContent = "";
+        results.forEach(function (key) {
+            var doc = docs[key];
+            if (!doc) return;
+            var article = document.createElement("article");
+            article.className = "post";
+            if (doc[2]) {
+                var wrap = document.createElement("div");
+                wrap.className = "img-thumbnail-wrap";
+                wrap.innerHTML = "<div class='img-thumbnail'></div>";
+                var img = document.createElement("img");
+                img.src = doc[2];
+                img.alt = doc[0] + " thumbnail";
+                img.loading = "lazy";
+                wrap.firstChild.appendChild(img);
+                article.appendChild(wrap);
+            }
+            var content = document.createElement("div");
+            content.className = "post-content-wrapper";
+            var title = document.createElement("h2");
+            title.className = "post-title entry-title";
+            var link = document.createElement("a");
+            link.href = doc[1];
+            link.textContent = doc[0];
+            title.appendChild(link);
+            var snippet = document.createElement("div");
+            snippet.className = "post-snippet";
+            snippet.textContent = doc[3];
+            var info = document.createElement("div");
+            info.className = "post-info info-1";
+            info.textContent = doc[4];
+            content.appendChild(title);
+            content.appendChild(snippet);
+            content.appendChild(info);
+            article.appendChild(content);
+            container.appendChild(article);
+        });
+    }
+
+    function search(query) {
+        var tokens = tokenize(query);
+        if (!tokens.length) {
+            setStatus("Masukkan kata kunci (minimal 2 huruf).");
+            return;
+        }
+        setStatus("Mencari “" + query + "”...");
+        getJSON("index.json").then(function (index) {
+            var n = index.prefix_length;
+            return Promise.all(tokens.map(function (token, i) {
+                var shard = index.terms[token.slice(0, n)];
+                if (!shard) return {};
+                return getJSON(shard).then(function (terms) {
+                    // Kata terakhir dicocokkan sebagai prefix (pencarian sambil mengetik), sisanya harus sama persis
+                    var scores = {};
+                    var isLast = i === tokens.length - 1;
+                    Object.keys(terms).forEach(function (term) {
+                        if (term === token || (isLast && term.indexOf(token) === 0)) {
+                            terms[term].forEach(function (posting) {
+                                scores[posting[0]] = Math.max(scores[posting[0]] || 0, posting[1]);
+                            });
+                        }
+                    });
+                    return scores;
+                });
+            })).then(function (perToken) {
+                var total = {}, matched = {}, order = [];
+                perToken.forEach(function (scores) {
+                    Object.keys(scores).forEach(function (key) {
+                        if (!(key in total)) { total[key] = 0; matched[key] = 0; order.push(key); }
+                        total[key] += scores[key];
+                        matched[key] += 1;
+                    });
+                });
+                // Postingan yang cocok dengan semua kata diutamakan; urutan awal (terbaru dulu) jadi penentu seri
+                var ranked = order.map(function (key, i) { return [key, matched[key], total[key], i]; });
+                ranked.sort(function (a, b) { return b[1] - a[1] || b[2] - a[2] || a[3] - b[3]; });
+                var results = ranked.slice(0, MAX_RESULTS).map(function (r) { return r[0]; });
+                var buckets = {};
+                results.forEach(function (key) { buckets[docBucket(key, index.buckets)] = true; });
+                return Promise.all(Object.keys(buckets).map(function (b) {
+                    return index.docs[b] ? getJSON(index.docs[b]) : {};
+                })).then(function (parts) {
+                    var docs = Object.assign.apply(null, [{}].concat(parts));
+                    renderResults(results, docs);
+                    setStatus(results.length ? "Hasil pencarian untuk “" + query + "”:" :
+                        "Tidak ada cerita yang cocok dengan “" + query + "”.");
+                });
+            });
+        }).catch(function () {
+            setStatus("Pencarian sedang tidak tersedia.");
+        });
+    }
+
+    var query = new URLSearchParams(window.location.search).get("q") || "";
+    var input = document.querySelector('#search-form input[type="search"]');
+    if (input) input.value = query;
+    search(query);
+})();
@@ -0,0 +1,166 @@
+# search_index.py
+# Indeks pencarian statis untuk pencarian di browser tanpa server:
+#   - inverted index dari judul, label, dan teks preview (hasil preprocessing, HTML tidak di-parse ulang),
+#   - term dibagi ke shard berdasarkan prefix 2 karakter, jadi browser hanya mengunduh shard yang dibutuhkan,
+#   - data postingan (judul, URL, thumbnail, preview) dibagi ke bucket berdasarkan id postingan,
+#   - nama setiap shard memuat hash isinya (cache jangka panjang); search/index.json memetakan
+#     prefix/bucket ke nama file dan merupakan satu-satunya file yang berubah di setiap build.
+# Id postingan dan pembagian bucket stabil antar build, jadi postingan baru hanya mengubah shard
+# untuk term-nya sendiri dan satu bucket; shard lain tetap dengan nama dan isi yang sama.
+import os
+import re
+import json
+import math
+import hashlib
+import unicodedata
+from collections import defaultdict
+from output_writer import write_if_changed
+
+SEARCH_DIR = 'search'
+INDEX_FILENAME = 'index.json'
+PREFIX_LENGTH = 2
+MIN_TERM_LENGTH = 2
+DOCS_PER_BUCKET = 256
+INDEX_VERSION = 1
+
+# Bobot field: kecocokan di judul paling penting, lalu label, lalu teks preview
+TITLE_WEIGHT = 3
+LABEL_WEIGHT = 2
+PREVIEW_WEIGHT = 1
+
+TOKEN_RE = re.compile(r'[^\W_]+')
+SAFE_NAME_RE = re.compile(r'^[a-z0-9]+$')
+BASE36_DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'
+
+
+def normalize(text):
+    """
+    Huruf kecil tanpa diakritik; search.js menormalisasi query dengan cara yang sama.
+    """
+    text = unicodedata.normalize('NFKD', text)
+    return ''.join(ch for ch in text if not unicodedata.combining(ch)).lower()
+
+
+def tokenize(text):
+    return [term for term in TOKEN_RE.findall(normalize(text or '')) if len(term) >= MIN_TERM_LENGTH]
+
+
+def doc_key(post):
+    """
+    Kunci pendek dan stabil untuk postingan: id Blogger (angka) dalam basis 36.
+    """
+    post_id = str(post['id'])
+    if not post_id.isdigit():
+        return post_id
+    number = int(post_id)
+    digits = []
+    while True:
+        number, remainder = divmod(number, 36)
+        digits.append(BASE36_DIGITS[remainder])
+        if not number:
+            return ''.join(reversed(digits))
+
+
+def bucket_count(total_docs):
+    """
+    Jumlah bucket selalu pangkat dua, jadi pembagian bucket hanya berubah saat jumlah postingan berlipat ganda.
+    """
+    return 1 << max(0, math.ceil(math.log2(max(1, total_docs) / DOCS_PER_BUCKET)))
+
+
+def doc_bucket(key, buckets):
+    return int(key[-2:], 36) % buckets if key[-2:].isalnum() else 0
+
+
+def _serialize(payload):
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+
+def _hashed_filename(prefix, data):
+    return f"{prefix}.{hashlib.sha1(data).hexdigest()[:10]}.json"
+
+
+def _safe_name(shard_key):
+    """
+    Prefix dengan karakter non-ASCII ditulis sebagai hex supaya nama file tetap aman di URL.
+    """
+    shard_key = str(shard_key)
+    return shard_key if SAFE_NAME_RE.match(shard_key) else 'x' + shard_key.encode('utf-8').hex()
+
+
+def build_search_index(posts, output_dir, published_date=None, output=None):
+    """
+    Menulis indeks pencarian ke output_dir/search/. posts harus sudah terurut (terbaru dulu) dan
+    sudah punya 'detail_url', 'thumbnail_url', dan 'parsed_content' dari preprocessing.
+    published_date(post) mengembalikan tanggal yang ditampilkan di hasil pencarian.
+    Mengembalikan jumlah file shard yang ditulis (termasuk yang tidak berubah).
+    """
+    search_dir = os.path.join(output_dir, SEARCH_DIR)
+    os.makedirs(search_dir, exist_ok=True)
+    buckets = bucket_count(len(posts))
+
+    postings = defaultdict(dict)  # term -> {doc key: bobot}, urutan insert = urutan postingan
+    docs = defaultdict(dict)      # bucket -> {doc key: [judul, url, thumbnail, preview, tanggal]}
+    for post in posts:
+        key = doc_key(post)
+        docs[doc_bucket(key, buckets)][key] = [
+            post.get('title', ''),
+            post.get('detail_url'),
+            post.get('thumbnail_url'),
+            post.get('parsed_content') or '',
+            published_date(post) if published_date else post.get('published', '')[:10],
+        ]
+        weights = {}
+        for text, weight in ((post.get('title'), TITLE_WEIGHT),
+                             (' '.join(post.get('labels', [])), LABEL_WEIGHT),
+                             (post.get('parsed_content'), PREVIEW_WEIGHT)):
+            for term in tokenize(text):
+                if weights.get(term, 0) < weight:
+                    weights[term] = weight
+        for term, weight in weights.items():
+            postings[term][key] = weight
+
+    shards = defaultdict(dict)
+    for term, doc_weights in postings.items():
+        # Bobot tertinggi dulu; dalam bobot yang sama tetap terbaru dulu
+        shards[term[:PREFIX_LENGTH]][term] = sorted(doc_weights.items(), key=lambda item: -item[1])
+
+    def write(path, data):
+        if output is not None:
+            output.write(path, data)
+        else:
+            write_if_changed(path, data)
+
+    index = {'version': INDEX_VERSION, 'prefix_length': PREFIX_LENGTH, 'buckets': buckets,
+             'terms': {}, 'docs': {}}
+    for group, items, name_prefix in (('terms', shards, 't-'), ('docs', docs, 'd-')):
+        for shard_key, payload in items.items():
+            data = _serialize(payload)
+            filename = _hashed_filename(name_prefix + _safe_name(shard_key), data)
+            write(os.path.join(search_dir, filename), data)
+            index[group][str(shard_key)] = filename
+
+    write(os.path.join(search_dir, INDEX_FILENAME), _serialize(index))
+    return len(shards) + len(docs)
+
+
+def keep_search_index(output_dir, output):
+    """
+    Build incremental tanpa perubahan postingan: tandai semua file indeks yang ada sebagai output
+    (supaya tidak di-prune) tanpa menulis ulang. Mengembalikan False jika indeks lama tidak lengkap.
+    """
+    search_dir = os.path.join(output_dir, SEARCH_DIR)
+    try:
+        with open(os.path.join(search_dir, INDEX_FILENAME), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if index.get('version') != INDEX_VERSION:
+        return False
+    paths = [os.path.join(search_dir, filename)
+             for group in ('terms', 'docs') for filename in index.get(group, {}).values()]
+    if not all(os.path.exists(path) for path in paths):
+        return False
+    for path in paths + [os.path.join(search_dir, INDEX_FILENAME)]:
+        output.keep(path)
+    return True
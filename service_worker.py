@@ -0,0 +1,183 @@
+# service_worker.py
+# Service worker yang dibuat saat build (precache-sw.js) beserta manifest precache-nya:
+#   - aset shell (halaman utama, style.css, logo.png) dan halaman N postingan terbaru di-precache,
+#     masing-masing dengan revisi = hash isi file hasil build,
+#   - kunci cache memuat revisi, jadi deploy baru hanya mengunduh ulang file yang isinya berubah
+#     dan entri lama dibuang saat service worker baru aktif,
+#   - halaman postingan lain disajikan stale-while-revalidate dari cache runtime,
+#   - versi (hash manifest) tertulis di file worker, jadi browser mendeteksi setiap deploy yang mengubah isinya.
+# sw.js di root repo adalah worker pihak ketiga (iklan) dan tidak disentuh; jika ada, worker ini
+# memuatnya lewat importScripts supaya tetap berjalan di scope yang sama.
+import os
+import json
+import hashlib
+
+SERVICE_WORKER_FILENAME = 'precache-sw.js'
+PRECACHE_MANIFEST_FILENAME = 'precache-manifest.json'
+LEGACY_WORKER_FILENAME = 'sw.js'
+# (URL, file di folder output); '/' disajikan dari index.html
+SHELL_ASSETS = (('/', 'index.html'), ('/style.css', 'style.css'), ('/logo.png', 'logo.png'))
+CACHE_PREFIX = 'tantemagz-'
+MAX_RUNTIME_PAGES = 50  # Batas halaman di cache stale-while-revalidate
+
+SERVICE_WORKER_SOURCE = """\
+// Dibuat otomatis oleh service_worker.py saat build; jangan diedit manual.
+__LEGACY_IMPORT__
+var VERSION = __VERSION__;
+var PRECACHE_ENTRIES = __ENTRIES__;
+var CACHE_PREFIX = __CACHE_PREFIX__;
+var PRECACHE = CACHE_PREFIX + "precache-v1";
+var PAGES = CACHE_PREFIX + "pages-v1";
+var MAX_RUNTIME_PAGES = __MAX_RUNTIME_PAGES__;
+
+// URL -> kunci cache yang memuat revisi; revisi yang sama antar deploy tidak diunduh ulang
+var precacheKeys = {};
+PRECACHE_ENTRIES.forEach(function (entry) {
+    precacheKeys[entry.url] = entry.url + "?__rev=" + entry.revision;
+});
+if (precacheKeys["/"]) precacheKeys["/index.html"] = precacheKeys["/"];
+
+self.addEventListener("install", function (event) {
+    event.waitUntil(caches.open(PRECACHE).then(function (cache) {
+        return Promise.all(PRECACHE_ENTRIES.map(function (entry) {
+            var key = precacheKeys[entry.url];
+            return cache.match(key).then(function (cached) {
+                if (cached) return;
+                return fetch(entry.url, {cache: "no-cache"}).then(function (response) {
+                    if (response.ok) return cache.put(key, response);
+                });
+            });
+        }));
+    }).then(function () {
+        return self.skipWaiting();
+    }));
+});
+
+self.addEventListener("activate", function (event) {
+    var current = {};
+    Object.keys(precacheKeys).forEach(function (url) {
+        current[new URL(precacheKeys[url], self.location).href] = true;
+    });
+    event.waitUntil(caches.keys().then(function (names) {
+        // Cache milik worker ini dari format lama dihapus; cache lain (misal milik sw.js) dibiarkan
+        return Promise.all(names.filter(function (name) {
+            return name.indexOf(CACHE_PREFIX) === 0 && name !== PRECACHE && name !== PAGES;
+        }).map(function (name) {
+            return caches.delete(name);
+        }));
+    }).then(function () {
+        return caches.open(PRECACHE);
+    }).then(function (cache) {
+        return cache.keys().then(function (requests) {
+            return Promise.all(requests.filter(function (request) {
+                return !current[request.url];
+            }).map(function (request) {
+                return cache.delete(request);
+            }));
+        });
+    }).then(function () {
+        return self.clients.claim();
+    }));
+});
+
+function trimPages(cache) {
+    return cache.keys().then(function (requests) {
+        return Promise.all(requests.slice(0, Math.max(0, requests.length - MAX_RUNTIME_PAGES)).map(function (request) {
+            return cache.delete(request);
+        }));
+    });
+}
+
+function staleWhileRevalidate(event, request) {
+    return caches.open(PAGES).then(function (cache) {
+        return cache.match(request).then(function (cached) {
+            var update = fetch(request).then(function (response) {
+                if (response.ok) {
+                    return cache.put(request, response.clone()).then(function () {
+                        return trimPages(cache);
+                    }).then(function () {
+                        return response;
+                    });
+                }
+                return response;
+            });
+            if (cached) {
+                event.waitUntil(update.catch(function () {}));
+                return cached;
+            }
+            return update;
+        });
+    });
+}
+
+self.addEventListener("fetch", function (event) {
+    var request = event.request;
+    var url = new URL(request.url);
+    if (request.method !== "GET" || url.origin !== self.location.origin) return;
+
+    var key = url.search ? null : precacheKeys[url.pathname];
+    if (key) {
+        event.respondWith(caches.open(PRECACHE).then(function (cache) {
+            return cache.match(key);
+        }).then(function (cached) {
+            return cached || fetch(request);
+        }));
+    } else if (request.mode === "navigate" || /\\.html$/.test(url.pathname)) {
+        event.respondWith(staleWhileRevalidate(event, request));
+    }
+});
+"""
+
+
+def file_revision(path):
+    """
+    Hash pendek isi file, atau None jika file tidak ada.
+    """
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()[:10]
+    except OSError:
+        return None
+
+
+def precache_entries(output_dir, recent_posts):
+    """
+    Entri precache: aset shell lalu halaman postingan terbaru, hanya file yang ada di output.
+    """
+    candidates = list(SHELL_ASSETS)
+    candidates.extend((post['detail_url'], post['detail_url'].lstrip('/')) for post in recent_posts)
+    entries, seen = [], set()
+    for url, relative_path in candidates:
+        if url in seen:
+            continue
+        seen.add(url)
+        revision = file_revision(os.path.join(output_dir, relative_path))
+        if revision is not None:
+            entries.append({'url': url, 'revision': revision})
+    return entries
+
+
+def build_service_worker(output_dir, recent_posts, output):
+    """
+    Menulis precache-manifest.json dan precache-sw.js ke output_dir. Dipanggil setelah semua halaman
+    ditulis, karena revisi dihitung dari isi file hasil build. Mengembalikan jumlah entri precache.
+    """
+    entries = precache_entries(output_dir, recent_posts)
+    manifest = json.dumps(entries, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+    version = hashlib.sha1(manifest.encode('utf-8')).hexdigest()[:10]
+
+    legacy_import = ''
+    if os.path.exists(os.path.join(output_dir, LEGACY_WORKER_FILENAME)):
+        legacy_import = f'try {{ importScripts("/{LEGACY_WORKER_FILENAME}"); }} catch (e) {{}}'
+    source = SERVICE_WORKER_SOURCE
+    for placeholder, value in (('__LEGACY_IMPORT__', legacy_import),
+                               ('__VERSION__', json.dumps(version)),
+                               ('__ENTRIES__', manifest),
+                               ('__CACHE_PREFIX__', json.dumps(CACHE_PREFIX)),
+                               ('__MAX_RUNTIME_PAGES__', str(MAX_RUNTIME_PAGES))):
+        source = source.replace(placeholder, value)
+
+    output.write(os.path.join(output_dir, PRECACHE_MANIFEST_FILENAME),
+                 json.dumps({'version': version, 'entries': entries}, ensure_ascii=False, indent=2))
+    output.write(os.path.join(output_dir, SERVICE_WORKER_FILENAME), source)
+    return len(entries)
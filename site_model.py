@@ -0,0 +1,94 @@
+# site_model.py
+# Model situs yang dihitung sekali: timestamp yang sudah di-parse, urutan global postingan,
+# partisi per label yang sudah terurut, potongan halaman (pagination), dan daftar label terurut.
+# Pembuatan halaman dan generate_sitemap sama-sama membaca dari model ini.
+import math
+from datetime import datetime
+from utils import slugify
+
+
+def parse_published(value):
+    """
+    Parse timestamp ISO 8601 dari Blogger (misal "2023-10-27T10:00:00Z").
+    """
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def paginate(posts, per_page):
+    """
+    Membagi daftar postingan menjadi potongan halaman. Mengembalikan list of list.
+    """
+    total_pages = math.ceil(len(posts) / per_page)
+    return [posts[(page_num - 1) * per_page:page_num * per_page] for page_num in range(1, total_pages + 1)]
+
+
+class SiteModel:
+    """
+    Atribut:
+        posts (list): Semua postingan yang punya tanggal 'published', terbaru dulu.
+        published (dict): post id -> datetime 'published' yang sudah di-parse.
+        updated (dict): post id -> datetime 'updated' (atau 'published' jika tidak ada).
+        labels (list): Semua label unik, terurut.
+        posts_by_label (dict): slug label -> {'name', 'slug', 'posts', 'pages'}; 'posts' terbaru dulu.
+        index_pages (list): Potongan postingan untuk index.html dan pages/*.html.
+        recent_posts (list): Postingan terbaru untuk widget sidebar.
+    """
+
+    def __init__(self, posts, posts_per_page=5, posts_per_category_page=5, num_recent_posts=5):
+        self.posts_per_page = posts_per_page
+        self.posts_per_category_page = posts_per_category_page
+
+        # Parse tanggal sekali per postingan
+        self.published = {}
+        self.updated = {}
+        dated_posts = []
+        for post in posts:
+            if 'published' in post:
+                self.published[post['id']] = parse_published(post['published'])
+                self.updated[post['id']] = self._parse_updated(post)
+                dated_posts.append(post)
+
+        # Urutan kategori mengikuti kemunculan pertama label di input (sama seperti sebelumnya)
+        self.posts_by_label = {}
+        all_labels = set()
+        for post in dated_posts:
+            for label in post.get('labels', []):
+                all_labels.add(label)
+                label_slug = slugify(label)
+                if label_slug not in self.posts_by_label:
+                    self.posts_by_label[label_slug] = {'name': label, 'slug': label_slug, 'posts': [], 'pages': []}
+        self.labels = sorted(all_labels)
+
+        # Satu kali sort global; partisi per label mewarisi urutannya (sort stabil),
+        # jadi tidak perlu sort ulang per kategori
+        self.posts = sorted(dated_posts, key=lambda p: self.published[p['id']], reverse=True)
+        for post in self.posts:
+            seen_slugs = set()
+            for label in post.get('labels', []):
+                label_slug = slugify(label)
+                if label_slug not in seen_slugs:
+                    seen_slugs.add(label_slug)
+                    self.posts_by_label[label_slug]['posts'].append(post)
+
+        self.index_pages = paginate(self.posts, posts_per_page)
+        for label_info in self.posts_by_label.values():
+            label_info['pages'] = paginate(label_info['posts'], posts_per_category_page)
+
+        self.recent_posts = self.posts[:num_recent_posts]
+
+    def _parse_updated(self, post):
+        try:
+            return parse_published(post['updated'])
+        except (KeyError, TypeError, ValueError):
+            return self.published[post['id']]
+
+    def published_date(self, post, fmt='%Y-%m-%d'):
+        return self.published[post['id']].strftime(fmt)
+
+    def lastmod(self, posts, fmt='%Y-%m-%d'):
+        """
+        Tanggal perubahan terakhir dari sekumpulan postingan (misal satu halaman paginasi), atau None.
+        """
+        if not posts:
+            return None
+        return max(self.updated[p['id']] for p in posts).strftime(fmt)
@@ -0,0 +1,160 @@
+# sitemap_writer.py
+# Penulis sitemap streaming: setiap entri langsung ditulis ke file shard (sitemap-N.xml atau
+# sitemap-N.xml.gz) dan shard baru dibuka sebelum batas protokol (50.000 URL / 50 MB) terlampaui.
+# Di akhir, sitemap_index.xml ditulis berisi semua shard.
+import os
+import re
+import gzip
+from xml.sax.saxutils import escape
+from output_writer import write_if_changed, commit_temp_file
+
+MAX_URLS_PER_SITEMAP = 50000
+MAX_BYTES_PER_SITEMAP = 50 * 1024 * 1024  # Batas ukuran file sitemap sebelum dikompresi
+SITEMAP_INDEX_FILENAME = 'sitemap_index.xml'
+
+URLSET_HEADER = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+""".encode('utf-8')
+URLSET_FOOTER = "\n</urlset>".encode('utf-8')
+
+URL_ENTRY_TEMPLATE = """    <url>
+        <loc>{loc}</loc>
+        {lastmod_tag}
+        <changefreq>{changefreq}</changefreq>
+        <priority>{priority}</priority>
+    </url>"""
+
+SHARD_FILENAME_RE = re.compile(r'^sitemap-(\d+)\.xml(\.gz)?$')
+
+
+class SitemapWriter:
+    """
+    Contoh pemakaian:
+        writer = SitemapWriter(output_dir, base_url)
+        writer.add(loc, lastmod, 'weekly', '0.8')
+        ...
+        writer.close()
+    """
+
+    def __init__(self, output_dir, base_url, gzip_output=True,
+                 max_urls=MAX_URLS_PER_SITEMAP, max_bytes=MAX_BYTES_PER_SITEMAP, output=None):
+        self.output_dir = output_dir
+        self.output = output  # OutputWriter opsional
+        self.base_url = base_url
+        self.gzip_output = gzip_output
+        self.max_urls = max_urls
+        self.max_bytes = max_bytes
+
+        self.shards = []  # [(nama file, lastmod terbaru di shard itu)]
+        self.total_urls = 0
+        self._file = None
+        self._raw_file = None
+        self._urls_in_shard = 0
+        self._bytes_in_shard = 0
+        self._shard_lastmod = None
+
+    def _shard_filename(self, number):
+        return f"sitemap-{number}.xml" + (".gz" if self.gzip_output else "")
+
+    def _open_shard(self):
+        filename = self._shard_filename(len(self.shards) + 1)
+        # Shard ditulis ke file sementara; baru dipindahkan saat selesai dan hanya jika isinya berubah
+        path = os.path.join(self.output_dir, filename + '.tmp')
+        self._raw_file = open(path, 'wb')
+        if self.gzip_output:
+            # mtime=0 supaya isi file .gz deterministik (tidak berubah jika isinya sama);
+            # nama di header gzip = nama shard akhir tanpa .gz, bukan nama file sementara
+            self._file = gzip.GzipFile(filename=filename.removesuffix('.gz'), mode='wb', mtime=0,
+                                       fileobj=self._raw_file)
+        else:
+            self._file = self._raw_file
+        self._file.write(URLSET_HEADER)
+        self.shards.append([filename, None])
+        self._urls_in_shard = 0
+        self._bytes_in_shard = len(URLSET_HEADER) + len(URLSET_FOOTER)
+        self._shard_lastmod = None
+
+    def _close_shard(self):
+        if self._file is None:
+            return
+        self._file.write(URLSET_FOOTER)
+        self._file.close()
+        # GzipFile dengan fileobj tidak menutup file di bawahnya
+        self._raw_file.close()
+        self._file = None
+        self._raw_file = None
+        self.shards[-1][1] = self._shard_lastmod
+        path = os.path.join(self.output_dir, self.shards[-1][0])
+        if self.output is not None:
+            self.output.commit(path + '.tmp', path)
+        else:
+            commit_temp_file(path + '.tmp', path)
+
+    def add(self, loc, lastmod, changefreq, priority):
+        lastmod_tag = f"<lastmod>{lastmod}</lastmod>" if lastmod else ""
+        entry = URL_ENTRY_TEMPLATE.format(
+            loc=escape(loc),
+            lastmod_tag=lastmod_tag,
+            changefreq=changefreq,
+            priority=priority
+        ).encode('utf-8')
+        separator = b"\n" if self._urls_in_shard else b""
+
+        if self._file is not None and (
+            self._urls_in_shard >= self.max_urls or
+            self._bytes_in_shard + len(separator) + len(entry) > self.max_bytes
+        ):
+            self._close_shard()
+            separator = b""
+        if self._file is None:
+            self._open_shard()
+
+        self._file.write(separator + entry)
+        self._urls_in_shard += 1
+        self._bytes_in_shard += len(separator) + len(entry)
+        self.total_urls += 1
+        if lastmod and (self._shard_lastmod is None or lastmod > self._shard_lastmod):
+            self._shard_lastmod = lastmod
+
+    def _remove_stale_shards(self):
+        """
+        Menghapus shard sisa build sebelumnya yang tidak lagi dihasilkan.
+        """
+        current = {filename for filename, _ in self.shards}
+        for filename in os.listdir(self.output_dir):
+            if SHARD_FILENAME_RE.match(filename) and filename not in current:
+                path = os.path.join(self.output_dir, filename)
+                if self.output is not None:
+                    self.output.remove(path)
+                else:
+                    os.remove(path)
+
+    def index_xml(self):
+        entries = []
+        for filename, lastmod in self.shards:
+            lastmod_tag = f"\n        <lastmod>{lastmod}</lastmod>" if lastmod else ""
+            entries.append(f"""    <sitemap>
+        <loc>{escape(self.base_url)}/{filename}</loc>{lastmod_tag}
+    </sitemap>""")
+        return f"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+{chr(10).join(entries)}
+</sitemapindex>"""
+
+    def close(self):
+        """
+        Menutup shard terakhir, menulis sitemap_index.xml, dan mengembalikan path file index.
+        """
+        self._close_shard()
+        if not self.shards:
+            # Tetap tulis satu sitemap (kosong) supaya index selalu valid
+            self._open_shard()
+            self._close_shard()
+        self._remove_stale_shards()
+
+        index_path = os.path.join(self.output_dir, SITEMAP_INDEX_FILENAME)
+        if self.output is not None:
+            self.output.write(index_path, self.index_xml())
+        else:
+            write_if_changed(index_path, self.index_xml())
+        return index_path
@@ -0,0 +1,69 @@
+# template_graph.py
+# Graf dependensi template: setiap template beserta template yang di-extends, di-include,
+# atau disisipkan lewat fragment() darinya (misal single_post_template.html -> base_template_post.html
+# -> custom_sidebar.html). Dipakai untuk sidik jari per jenis halaman di build incremental,
+# CSS kritis per template, dan untuk menentukan halaman mana yang terdampak perubahan template.
+import os
+import re
+import hashlib
+
+TEMPLATE_REFERENCE_RE = re.compile(r'''(?:extends|include|import|fragment\()\s*["']([^"']+)["']''')
+
+
+class TemplateGraph:
+    """
+    Dibaca dari disk sekali per instance; buat instance baru setelah template berubah.
+    """
+
+    def __init__(self, template_dir):
+        self.template_dir = template_dir
+        self._sources = {}
+
+    def source(self, name):
+        """
+        Source template, atau None jika file tidak ada.
+        """
+        if name not in self._sources:
+            path = os.path.join(self.template_dir, name)
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._sources[name] = f.read()
+            else:
+                self._sources[name] = None
+        return self._sources[name]
+
+    def references(self, name):
+        source = self.source(name)
+        return TEMPLATE_REFERENCE_RE.findall(source) if source is not None else []
+
+    def dependencies(self, name):
+        """
+        name beserta semua template yang dipakainya secara transitif (yang ada di disk),
+        template itu sendiri lebih dulu.
+        """
+        seen, order, stack = set(), [], [name]
+        while stack:
+            current = stack.pop()
+            if current in seen or self.source(current) is None:
+                continue
+            seen.add(current)
+            order.append(current)
+            stack.extend(reversed(self.references(current)))
+        return order
+
+    def digest(self, name):
+        """
+        Digest dari template dan semua dependensinya; berubah hanya jika salah satu file itu berubah.
+        """
+        h = hashlib.sha1()
+        for dependency in sorted(self.dependencies(name)):
+            h.update(dependency.encode('utf-8'))
+            h.update(self.source(dependency).encode('utf-8'))
+        return h.hexdigest()
+
+    def affected(self, changed, template_names):
+        """
+        Template dari template_names yang (secara transitif) memakai salah satu template di changed.
+        """
+        changed = set(changed)
+        return [name for name in template_names if changed.intersection(self.dependencies(name))]
@@ -0,0 +1,28 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from asset_pipeline import minify_html
+
+
+def test_text_between_tags_is_collapsed():
+    html = '<div>\n    <p>a    b</p>   <!-- note -->  <span>c</span>\n</div>\n'
+    assert minify_html(html) == '<div>\n<p>a b</p> <span>c</span>\n</div>'
+
+
+def test_attribute_values_are_kept():
+    html = '<img   alt="two  spaces"\n     title=\'line\n  break\' data-x="a > b">  x'
+    assert minify_html(html) == '<img alt="two  spaces"\ntitle=\'line\n  break\' data-x="a > b"> x'
+
+
+def test_preformatted_elements_are_kept():
+    html = ('<div style="color: red; white-space: pre-wrap">a   b\n  <div>c   d</div>  </div>  e   f'
+            '<pre>x    y</pre><textarea>  t  </textarea><script>if (a  <  b) {}</script>')
+    assert minify_html(html) == ('<div style="color: red; white-space: pre-wrap">a   b\n  <div>c   d</div>  </div> e f'
+                                 '<pre>x    y</pre><textarea>  t  </textarea><script>if (a  <  b) {}</script>')
+
+
+def test_conditional_comments_are_kept():
+    html = '<!--[if IE]>  <p>x</p>  <![endif]-->  <p>y</p>'
+    assert minify_html(html) == '<!--[if IE]>  <p>x</p>  <![endif]--> <p>y</p>'
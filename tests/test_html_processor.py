@@ -0,0 +1,33 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from html_processor import process_post_html
+
+
+def round_trip(html):
+    return process_post_html(html)[2]
+
+
+def test_bare_ampersand_is_kept():
+    html = '<p>Tom&Jerry and AT&T</p>'
+    assert round_trip(html) == html
+    assert process_post_html(html)[1] == 'Tom&Jerry and AT&T'
+
+
+def test_reference_without_semicolon_is_kept():
+    html = 'a=1&b=2 &copy 2020 &#x41 end &copy'
+    assert round_trip(html) == html
+    assert process_post_html(html)[1] == 'a=1&b=2 © 2020 A end ©'
+
+
+def test_reference_with_semicolon_is_kept():
+    html = '<p>x &amp; y &#169;</p>'
+    assert round_trip(html) == html
+    assert process_post_html(html)[1] == 'x & y ©'
+
+
+def test_cdata_and_comments_are_kept():
+    html = '<![CDATA[x]]><!-- c --><![if IE]>z<![endif]><P>a</P >'
+    assert round_trip(html) == html
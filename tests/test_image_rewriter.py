@@ -0,0 +1,34 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from html_processor import process_post_html
+from image_rewriter import resize_blogger_image_url, split_blogger_image_url
+
+IMG_A = 'https://blogger.googleusercontent.com/img/a/AVvXsEabc'
+IMG_B = 'https://blogger.googleusercontent.com/img/b/R29v/AVv'
+
+
+def test_suffix_size_token_is_split():
+    assert split_blogger_image_url(f'{IMG_A}=w640-h480') == (f'{IMG_A}=', 'w640-h480', '', '')
+    assert split_blogger_image_url(f'{IMG_A}=s1600-rw') == (f'{IMG_A}=', 's1600', '-rw', '')
+    assert resize_blogger_image_url(f'{IMG_A}=s1600-rw', 's320') == f'{IMG_A}=s320-rw'
+
+
+def test_path_size_token_is_unchanged():
+    assert resize_blogger_image_url(f'{IMG_B}/s1600/p.jpg', 's320') == f'{IMG_B}/s320/p.jpg'
+    assert resize_blogger_image_url(f'{IMG_B}/w640-h480-rw/p.jpg', 's800') == f'{IMG_B}/s800-rw/p.jpg'
+
+
+def test_suffix_size_token_gets_responsive_attributes():
+    thumbnail, _, html = process_post_html(f'<p>x</p><img src="{IMG_A}=w640-h480">', image_size='s800')
+    assert thumbnail == f'{IMG_A}=s320'
+    assert f'src="{IMG_A}=w800-h600"' in html
+    assert f'{IMG_A}=w320-h240 320w' in html
+    assert 'sizes="(max-width: 800px) 100vw, 800px"' in html
+    assert 'width="800" height="600"' in html
+
+
+def test_non_blogger_urls_are_left_alone():
+    assert split_blogger_image_url('https://example.com/a=s1600') is None
@@ -1,6 +1,18 @@
 # utils.py (Revisi untuk mendukung page_token)
 import os
-import requests
+import re
+from blogger_fetcher import fetch_posts_page, BloggerFetchError
+
+def slugify(text):
+    """
+    Mengubah teks (judul/label) menjadi slug untuk nama file dan URL.
+    """
+    text = str(text).lower()
+    text = re.sub(r'[^a-z0-9\s-]', '', text)
+    text = re.sub(r'[\s_-]+', '-', text)
+    text = re.sub(r'^-+', '', text)
+    text = re.sub(r'-+$', '', text)
+    return text
 
 def get_secret(key):
     """
@@ -12,28 +24,17 @@ def get_secret(key):
     return value
 
 # --- FUNGSI get_blogger_posts YANG DIPERBARUI ---
-def get_blogger_posts(blog_id, api_key, max_results=10, page_token=None): # <-- Tambahkan page_token=None di sini
+def get_blogger_posts(blog_id, api_key, max_results=10, page_token=None, order_by=None): # <-- Tambahkan page_token=None di sini
     """
     Fetches a list of posts from a specified Blogger blog.
+    order_by bisa 'published' (default API) atau 'updated' (dipakai untuk delta fetch).
+    Memakai session bersama (koneksi dipakai ulang, timeout, retry/backoff) dari blogger_fetcher.
+    Mengembalikan None jika gagal; pakai blogger_fetcher.iter_pages untuk fetch semua halaman.
     """
-    base_url = f"https://www.googleapis.com/blogger/v3/blogs/{blog_id}/posts"
-    
-    # Siapkan parameter untuk request
-    params = {
-        'key': api_key,
-        'fetchBodies': True, # Pastikan konten postingan juga diambil
-        'maxResults': max_results
-    }
-    
-    # Jika ada page_token, tambahkan ke parameter
-    if page_token:
-        params['pageToken'] = page_token
-
     try:
-        response = requests.get(base_url, params=params) # Gunakan params dictionary
-        response.raise_for_status()  # Raise an exception for HTTP errors
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        return fetch_posts_page(blog_id, api_key, max_results=max_results,
+                                page_token=page_token, order_by=order_by)
+    except BloggerFetchError as e:
         print(f"Error fetching Blogger posts: {e}")
         return None
 # --- AKHIR FUNGSI get_blogger_posts YANG DIPERBARUI ---